@@ -8,9 +8,14 @@ NIM             : 1313623028
 """
 
 from collections import deque
-import re, graphviz, tkinter, os
+import re, graphviz, tkinter, os, sys
 from tkinter import filedialog
 
+# Format file graf biner (.grf) didefinisikan di modul djikstra
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'djikstra'))
+from csr_graph import CSRGraph
+from graph_file import read_graph_file, write_graph_file
+
 def clear_terminal_screen():
     # For Windows
     if os.name == "nt":
@@ -191,7 +196,7 @@ class Graph:
         root.withdraw()
         file_path = filedialog.asksaveasfilename(
             defaultextension=".dot",
-            filetypes=[("DOT files", "*.dot"), ("All files", "*.*")],
+            filetypes=[("DOT files", "*.dot"), ("Binary graph files", "*.grf"), ("All files", "*.*")],
             title="Simpan Struktur Data Graf Saat Ini Sebagai File GraphViz .DOT"
         )
         
@@ -199,6 +204,10 @@ class Graph:
             print("Operasi penyimpanan dibatalkan.")
             return
         
+        if file_path.lower().endswith('.grf'):
+            self.save_graph_to_binary_file(file_path)
+            return
+        
         try:
             with open(file_path, "w") as file:
                 file.write("digraph G {\n")
@@ -232,7 +241,7 @@ class Graph:
         root.withdraw()
         file_path = filedialog.askopenfilename(
             defaultextension=".dot",
-            filetypes=[("DOT files", "*.dot"), ("All files", "*.*")],
+            filetypes=[("DOT files", "*.dot"), ("Binary graph files", "*.grf"), ("All files", "*.*")],
             title="Buka File Graph .DOT"
         )
         
@@ -240,6 +249,10 @@ class Graph:
             print("Operasi pemuatan dibatalkan.")
             return
         
+        if file_path.lower().endswith('.grf'):
+            self.load_graph_from_binary_file(file_path)
+            return
+        
         try:
             
             temporary_adjacency_list = {}
@@ -268,25 +281,66 @@ class Graph:
                         if to_node not in temporary_adjacency_list[from_node]:
                             temporary_adjacency_list[from_node].append(to_node)
 
-            print("\nRepresentasi Adjacency List dari file GraphViz .DOT yang dipilih: " + "KOSONG" if not temporary_adjacency_list else "")
-
-            for node, edges in temporary_adjacency_list.items():
-                print(f"{node}: {', '.join(edges) if edges else 'TIDAK ADA EDGE/ KONEKSI'}")
-                
-            print("")
-            
-            confirmation = input("Apakah Anda yakin untuk ingin memuat konfigurasi data graf ini ke dalam instance program yang sedang berjalan? (y/N): ").strip().lower()
+            self.confirm_loading_adjacency_list(temporary_adjacency_list, file_path, "file GraphViz .DOT")
             
-            if not confirmation.startswith('y'):
-                print("Operasi pemuatan dibatalkan.")
-                return
+        except Exception as error:
+            print(f"Terjadi kesalahan saat mencoba memuat file data graf: {error}")
+
+    def confirm_loading_adjacency_list(self, temporary_adjacency_list, file_path, file_description):
+        
+        """
+        Menampilkan adjacency list hasil pembacaan file ke terminal, lalu meminta konfirmasi pengguna
+        sebelum adjacency list tersebut menggantikan graf yang sedang dimuat.
+        Dipakai oleh pemuatan file .DOT maupun file graf biner .grf.
+        """
+        
+        print(f"\nRepresentasi Adjacency List dari {file_description} yang dipilih: " + ("KOSONG" if not temporary_adjacency_list else ""))
+
+        for node, edges in temporary_adjacency_list.items():
+            print(f"{node}: {', '.join(edges) if edges else 'TIDAK ADA EDGE/ KONEKSI'}")
             
-            self.adjacency_list = temporary_adjacency_list
+        print("")
+        
+        confirmation = input("Apakah Anda yakin untuk ingin memuat konfigurasi data graf ini ke dalam instance program yang sedang berjalan? (y/N): ").strip().lower()
+        
+        if not confirmation.startswith('y'):
+            print("Operasi pemuatan dibatalkan.")
+            return
+        
+        self.adjacency_list = temporary_adjacency_list
+        
+        print(f"Konfigurasi data graf telah berhasil dimuat ke dalam instance program yang sedang berjalan dari '{file_path}'.")
+
+    def save_graph_to_binary_file(self, file_path):
+        
+        """
+        Menyimpan struktur data graf yang sedang dimuat ke dalam file graf biner .grf (lihat djikstra/graph_file.py).
+        Setiap edge disimpan dengan bobot 1 karena graf pada program ini tidak berbobot.
+        """
+        
+        try:
+            graph = {node: {edge: 1 for edge in edges} for node, edges in self.adjacency_list.items()}
+            write_graph_file(file_path, CSRGraph.from_dict(graph))
+            print(f"Data graf yang sedang dimuat saat ini telah berhasil disimpan ke file graf biner '{file_path}'.")
             
-            print(f"Konfigurasi data graf telah berhasil dimuat ke dalam instance program yang sedang berjalan dari '{file_path}'.")
+        except Exception as exception:
+            print(f"Terjadi kesalahan saat mencoba menyimpan data graf ke dalam file graf biner: {exception}")
+
+
+    def load_graph_from_binary_file(self, file_path):
+        
+        """
+        Memuat graf dari file graf biner .grf lewat mmap, tanpa mem-parse teks .DOT sama sekali.
+        Sama seperti file .DOT, adjacency list hasil pembacaan ditampilkan dan harus dikonfirmasi dulu sebelum dimuat.
+        """
+        
+        try:
+            graph = read_graph_file(file_path).to_dict()
+            temporary_adjacency_list = {node: list(edges) for node, edges in graph.items()}
+            self.confirm_loading_adjacency_list(temporary_adjacency_list, file_path, "file graf biner .grf")
             
         except Exception as error:
-            print(f"Terjadi kesalahan saat mencoba memuat file data graf: {error}")
+            print(f"Terjadi kesalahan saat mencoba memuat file graf biner: {error}")
 
     def print_adjacency_list(self):
         
@@ -0,0 +1,162 @@
+import heapq
+import json
+
+from djikstra import build_reverse_graph, choose_queue, dijkstra
+
+class ALTIndex:
+    """
+    Preprocessing ALT (A*, Landmarks, Triangle inequality) di atas djikstra.dijkstra.
+    Untuk setiap landmark L disimpan dua tabel jarak:
+        forward[L][v]  = jarak terpendek L -> v
+        backward[L][v] = jarak terpendek v -> L
+    Dari ketidaksamaan segitiga, untuk setiap landmark berlaku
+        d(v, t) >= d(L, t) - d(L, v)   dan   d(v, t) >= d(v, L) - d(t, L)
+    sehingga nilai maksimumnya bisa dipakai sebagai heuristic A* yang tidak pernah melebihi jarak sebenarnya.
+    """
+
+    def __init__(self, graph, landmarks, forward, backward):
+        self.graph = graph
+        self.landmarks = list(landmarks)
+        self.forward = forward
+        self.backward = backward
+        # Jumlah node yang di-settle pada query terakhir (untuk evaluasi)
+        self.last_settled_count = 0
+
+    @classmethod
+    def build(cls, graph, num_landmarks=8, strategy='farthest'):
+        """
+        Memilih num_landmarks landmark lalu menghitung tabel jarak maju dan mundurnya.
+        strategy='farthest': setiap landmark baru adalah node terjauh dari landmark yang sudah dipilih.
+        strategy='degree': landmark adalah node dengan derajat (masuk + keluar) terbesar.
+        """
+        reverse_graph = build_reverse_graph(graph)
+        nodes = list(reverse_graph)
+        num_landmarks = min(num_landmarks, len(nodes))
+
+        landmarks = []
+        forward = {}
+        backward = {}
+
+        # Graf terbalik punya bobot yang sama, jadi jenis queue cukup ditentukan sekali
+        queue = choose_queue(graph)
+
+        def add_landmark(landmark):
+            landmarks.append(landmark)
+            forward[landmark] = dijkstra(graph, landmark, queue=queue)[0] if landmark in graph else {landmark: 0}
+            backward[landmark] = dijkstra(reverse_graph, landmark, queue=queue)[0]
+
+        if strategy == 'degree':
+            degree = {node: len(graph.get(node, {})) + len(reverse_graph[node]) for node in nodes}
+            for landmark in sorted(nodes, key=lambda node: degree[node], reverse=True)[:num_landmarks]:
+                add_landmark(landmark)
+        elif strategy == 'farthest':
+            # Jarak "gabungan" terkecil dari setiap node ke landmark-landmark yang sudah dipilih
+            closest = {node: float('infinity') for node in nodes}
+            candidate = nodes[0] if nodes else None
+            while candidate is not None and len(landmarks) < num_landmarks:
+                add_landmark(candidate)
+                for node in nodes:
+                    reach = min(forward[candidate].get(node, float('infinity')), backward[candidate].get(node, float('infinity')))
+                    closest[node] = min(closest[node], reach)
+
+                # Pilih node terjauh yang masih terjangkau; jika tidak ada, ambil node yang belum terjangkau sama sekali
+                candidate = None
+                farthest = -1
+                for node in nodes:
+                    if node in forward:
+                        continue
+                    distance = closest[node]
+                    if distance == float('infinity'):
+                        if candidate is None:
+                            candidate = node
+                        continue
+                    if distance > farthest:
+                        farthest = distance
+                        candidate = node
+        else:
+            raise ValueError(f"Strategi pemilihan landmark tidak dikenal: {strategy}")
+
+        return cls(graph, landmarks, forward, backward)
+
+    def lower_bound(self, node, end_node):
+        """
+        Batas bawah jarak node -> end_node dari semua landmark (heuristic A*).
+        """
+        best = 0
+        infinity = float('infinity')
+        for landmark in self.landmarks:
+            from_landmark = self.forward[landmark]
+            to_landmark = self.backward[landmark]
+
+            landmark_to_end = from_landmark.get(end_node, infinity)
+            landmark_to_node = from_landmark.get(node, infinity)
+            if landmark_to_end != infinity and landmark_to_node != infinity:
+                best = max(best, landmark_to_end - landmark_to_node)
+
+            node_to_landmark = to_landmark.get(node, infinity)
+            end_to_landmark = to_landmark.get(end_node, infinity)
+            if node_to_landmark != infinity and end_to_landmark != infinity:
+                best = max(best, node_to_landmark - end_to_landmark)
+        return best
+
+    def query(self, start_node, end_node):
+        """
+        Query A* satu pasang dengan heuristic dari landmark.
+        Mengembalikan (jarak, jalur) dengan jalur berformat 'a -> b -> c', atau (infinity, None) jika tidak terjangkau.
+        """
+        distances = {start_node: 0}
+        previous_nodes = {start_node: None}
+        settled = set()
+        priority_queue = [(self.lower_bound(start_node, end_node), 0, start_node)]
+
+        while priority_queue:
+            _, current_distance, current_node = heapq.heappop(priority_queue)
+            if current_node in settled:
+                continue
+            settled.add(current_node)
+
+            if current_node == end_node:
+                break
+
+            for neighbor, weight in self.graph.get(current_node, {}).items():
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, float('infinity')):
+                    distances[neighbor] = distance
+                    previous_nodes[neighbor] = current_node
+                    heapq.heappush(priority_queue, (distance + self.lower_bound(neighbor, end_node), distance, neighbor))
+
+        self.last_settled_count = len(settled)
+        if end_node not in settled:
+            return float('infinity'), None
+
+        path = []
+        current_node = end_node
+        while current_node is not None:
+            path.append(current_node)
+            current_node = previous_nodes[current_node]
+        return distances[end_node], ' -> '.join(path[::-1])
+
+    def save(self, filename):
+        """
+        Menyimpan daftar landmark dan tabel jaraknya ke file JSON supaya bisa dimuat ulang tanpa preprocessing.
+        Jarak tak hingga tidak disimpan (node yang tidak ada di tabel dianggap tidak terjangkau).
+        """
+        def finite(table):
+            return {node: distance for node, distance in table.items() if distance != float('infinity')}
+
+        data = {
+            'landmarks': self.landmarks,
+            'forward': {landmark: finite(self.forward[landmark]) for landmark in self.landmarks},
+            'backward': {landmark: finite(self.backward[landmark]) for landmark in self.landmarks},
+        }
+        with open(filename, 'w') as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, graph, filename):
+        """
+        Memuat tabel landmark yang sudah disimpan dengan save() untuk graf yang sama.
+        """
+        with open(filename, 'r') as f:
+            data = json.load(f)
+        return cls(graph, data['landmarks'], data['forward'], data['backward'])
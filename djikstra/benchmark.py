@@ -0,0 +1,134 @@
+"""
+Benchmark sederhana untuk membandingkan waktu dan puncak memori (tracemalloc) dari
+beberapa varian algoritma pada graf acak yang padat.
+Cara menjalankan: python benchmark.py [jumlah_node] [kepadatan]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from csr_graph import CSRGraph, dijkstra_csr
+from delta_stepping import delta_stepping
+from djikstra import dijkstra
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'mst'))
+from boruvka import boruvka_mst
+from kruskal import MyGraph
+from prim import PrimGraph
+
+def random_directed_graph(num_nodes, density, max_weight=1000, seed=0):
+    """
+    Graf berarah acak berbentuk dict-of-dicts dengan nama node 'n0', 'n1', ...
+    """
+    rng = random.Random(seed)
+    names = [f"n{i}" for i in range(num_nodes)]
+    graph = {name: {} for name in names}
+    for src in names:
+        for dst in names:
+            if src != dst and rng.random() < density:
+                graph[src][dst] = rng.randint(1, max_weight)
+    return graph
+
+def path_graph(num_nodes, weight=1):
+    """
+    Graf berarah berbentuk satu jalur panjang n0 -> n1 -> ... dengan bobot yang sama.
+    Diameternya sebesar jumlah node, jadi delta-stepping harus melewati satu bucket per node.
+    """
+    names = [f"n{i}" for i in range(num_nodes)]
+    graph = {name: {} for name in names}
+    for src, dst in zip(names, names[1:]):
+        graph[src][dst] = weight
+    return graph
+
+def random_prim_graph(num_nodes, density, max_weight=1000, seed=0):
+    """
+    Graf tak berarah acak dalam bentuk PrimGraph.
+    """
+    rng = random.Random(seed)
+    graph = PrimGraph(num_nodes)
+    for u in range(num_nodes):
+        for v in range(u + 1, num_nodes):
+            if rng.random() < density:
+                graph.addEdge(u, v, rng.randint(1, max_weight))
+    return graph
+
+def measure(function, *args, **kwargs):
+    """
+    Menjalankan function sekali, mengembalikan (waktu dalam detik, puncak memori dalam byte).
+    Output print dari function dibuang supaya tidak mengganggu hasil benchmark.
+    """
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    tracemalloc.start()
+    try:
+        start_time = time.perf_counter()
+        function(*args, **kwargs)
+        elapsed = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        sys.stdout.close()
+        sys.stdout = stdout
+    return elapsed, peak
+
+def report(label, elapsed, peak):
+    print(f"{label:<30} waktu: {elapsed * 1000:10.2f} ms   puncak memori: {peak / 1024:10.1f} KiB")
+
+def benchmark_priority_queues(num_nodes, density):
+    print(f"\nDijkstra, {num_nodes} node, kepadatan {density}:")
+    graph = random_directed_graph(num_nodes, density)
+    report("heapq (lazy deletion)", *measure(dijkstra, graph, "n0", queue='heap'))
+    report("IndexedHeap (decrease_key)", *measure(dijkstra, graph, "n0", queue='indexed'))
+
+    print(f"\nPrim, {num_nodes} node, kepadatan {density}:")
+    prim_graph = random_prim_graph(num_nodes, density)
+    report("heapq (lazy deletion)", *measure(prim_graph.primMST, 0, heap='lazy'))
+    report("IndexedHeap (decrease_key)", *measure(prim_graph.primMST, 0, heap='indexed'))
+    report("dense (argmin NumPy)", *measure(prim_graph.primMST, 0, heap='dense'))
+
+def benchmark_prim_complete_graph(num_nodes):
+    # Graf lengkap (kepadatan 1.0): kasus yang dipilih heap='auto' untuk mode dense
+    print(f"\nPrim pada graf lengkap, {num_nodes} node:")
+    prim_graph = random_prim_graph(num_nodes, 1.0)
+    report("heapq (lazy deletion)", *measure(prim_graph.primMST, 0, heap='lazy'))
+    report("IndexedHeap (decrease_key)", *measure(prim_graph.primMST, 0, heap='indexed'))
+    report("dense (argmin NumPy)", *measure(prim_graph.primMST, 0, heap='dense'))
+
+def benchmark_delta_stepping(num_nodes, density, deltas=(None, 10, 100, 1000)):
+    print(f"\nDelta-stepping vs Dijkstra (heapq) pada CSR, {num_nodes} node, kepadatan {density}:")
+    csr = CSRGraph.from_dict(random_directed_graph(num_nodes, density))
+    report("dijkstra_csr (heapq)", *measure(dijkstra_csr, csr, 0))
+    for delta in deltas:
+        label = "delta_stepping (delta=auto)" if delta is None else f"delta_stepping (delta={delta})"
+        report(label, *measure(delta_stepping, csr, 0, delta))
+
+    # Kasus terburuk delta-stepping: jalur panjang dengan banyak bucket yang masing-masing hanya berisi satu node
+    path_length = max(num_nodes, 20000)
+    print(f"\nDelta-stepping vs Dijkstra (heapq) pada CSR, jalur {path_length} node berbobot 1:")
+    csr = CSRGraph.from_dict(path_graph(path_length))
+    report("dijkstra_csr (heapq)", *measure(dijkstra_csr, csr, 0))
+    report("delta_stepping (delta=auto)", *measure(delta_stepping, csr, 0))
+
+def benchmark_mst(num_nodes, density):
+    print(f"\nMST, {num_nodes} node, kepadatan {density}:")
+    prim_graph = random_prim_graph(num_nodes, density)
+    kruskal_graph = MyGraph(num_nodes)
+    for u in range(num_nodes):
+        for v, w in prim_graph.adj[u]:
+            if u < v:
+                kruskal_graph.addEdge(u, v, w)
+    report("Prim (heapq)", *measure(prim_graph.primMST, 0, heap='lazy'))
+    report("Kruskal (sort)", *measure(kruskal_graph.KruskalMST))
+    report("Kruskal (radix)", *measure(kruskal_graph.KruskalMST, mode='radix'))
+    report("Boruvka (NumPy)", *measure(boruvka_mst, prim_graph))
+
+if __name__ == "__main__":
+    num_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    density = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    benchmark_priority_queues(num_nodes, density)
+    benchmark_prim_complete_graph(num_nodes)
+    benchmark_delta_stepping(num_nodes, density)
+    benchmark_mst(num_nodes, density)
@@ -0,0 +1,208 @@
+import heapq
+
+class ContractionHierarchy:
+    """
+    Contraction Hierarchies (CH) untuk menjawab banyak query jalur terpendek pada graf yang statis.
+    Preprocessing mengontraksi node satu per satu (urutan berdasarkan edge difference) dan menambahkan
+    shortcut u -> x untuk setiap jalur u -> v -> x yang tidak punya jalur pengganti (witness) yang sama pendek.
+    Query berupa Dijkstra dua arah yang hanya bergerak "ke atas" (ke node dengan rank lebih tinggi).
+    """
+
+    def __init__(self, rank, upward, backward_upward, middle):
+        # rank[node]: urutan kontraksi node (semakin besar semakin "penting")
+        self.rank = rank
+        # upward[u] = {x: bobot} untuk edge u -> x dengan rank[x] > rank[u]
+        self.upward = upward
+        # backward_upward[u] = {x: bobot} untuk edge x -> u dengan rank[x] > rank[u]
+        self.backward_upward = backward_upward
+        # middle[(u, x)] = v jika edge u -> x adalah shortcut dari u -> v -> x
+        self.middle = middle
+
+    @classmethod
+    def build(cls, graph, witness_settle_limit=500):
+        """
+        Membangun hierarki dari graf dict-of-dicts seperti {'s': {'u': 10}, ...}.
+        witness_settle_limit membatasi jumlah node yang di-settle pada setiap witness search;
+        batas yang lebih kecil mempercepat preprocessing tetapi bisa menambah shortcut yang sebenarnya tidak perlu.
+        """
+        nodes = list(graph)
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                if neighbor not in graph and neighbor not in nodes:
+                    nodes.append(neighbor)
+
+        # Graf sisa (node yang belum dikontraksi), disimpan dua arah
+        out_edges = {node: {} for node in nodes}
+        in_edges = {node: {} for node in nodes}
+        for src, neighbors in graph.items():
+            for dst, weight in neighbors.items():
+                if src != dst and weight < out_edges[src].get(dst, float('infinity')):
+                    out_edges[src][dst] = weight
+                    in_edges[dst][src] = weight
+
+        middle = {}
+        rank = {}
+        upward = {}
+        backward_upward = {}
+        contracted_neighbors = {node: 0 for node in nodes}
+
+        def shortcuts_for(node):
+            return cls._shortcuts_for(node, out_edges, in_edges, witness_settle_limit)
+
+        def priority(node, shortcuts):
+            edge_difference = len(shortcuts) - len(out_edges[node]) - len(in_edges[node])
+            return edge_difference + contracted_neighbors[node]
+
+        priority_queue = [(priority(node, shortcuts_for(node)), i, node) for i, node in enumerate(nodes)]
+        heapq.heapify(priority_queue)
+
+        while priority_queue:
+            _, i, node = heapq.heappop(priority_queue)
+
+            # Lazy update: hitung ulang prioritas, kembalikan ke queue jika sudah bukan yang terkecil.
+            # Shortcut yang dihitung di sini langsung dipakai untuk kontraksi, jadi witness search tidak diulang
+            shortcuts = shortcuts_for(node)
+            current_priority = priority(node, shortcuts)
+            if priority_queue and current_priority > priority_queue[0][0]:
+                heapq.heappush(priority_queue, (current_priority, i, node))
+                continue
+
+            rank[node] = len(rank)
+            upward[node] = out_edges[node]
+            backward_upward[node] = in_edges[node]
+
+            # Lepaskan node dari graf sisa
+            for neighbor in out_edges[node]:
+                del in_edges[neighbor][node]
+                contracted_neighbors[neighbor] += 1
+            for neighbor in in_edges[node]:
+                del out_edges[neighbor][node]
+                contracted_neighbors[neighbor] += 1
+            out_edges[node] = {}
+            in_edges[node] = {}
+
+            for src, dst, weight in shortcuts:
+                if weight < out_edges[src].get(dst, float('infinity')):
+                    out_edges[src][dst] = weight
+                    in_edges[dst][src] = weight
+                    middle[(src, dst)] = node
+
+        return cls(rank, upward, backward_upward, middle)
+
+    @staticmethod
+    def _shortcuts_for(node, out_edges, in_edges, witness_settle_limit):
+        """
+        Daftar shortcut (src, dst, bobot) yang dibutuhkan jika node dikontraksi dari graf sisa.
+        """
+        shortcuts = []
+        if not out_edges[node]:
+            return shortcuts
+        max_out_weight = max(out_edges[node].values())
+
+        for src, in_weight in in_edges[node].items():
+            # Witness search: Dijkstra lokal dari src yang tidak boleh melewati node
+            max_distance = in_weight + max_out_weight
+            distances = {src: 0}
+            priority_queue = [(0, src)]
+            settled_count = 0
+            while priority_queue and settled_count < witness_settle_limit:
+                current_distance, current_node = heapq.heappop(priority_queue)
+                if current_distance > distances[current_node]:
+                    continue
+                if current_distance > max_distance:
+                    break
+                settled_count += 1
+                for neighbor, weight in out_edges[current_node].items():
+                    if neighbor == node:
+                        continue
+                    distance = current_distance + weight
+                    if distance < distances.get(neighbor, float('infinity')):
+                        distances[neighbor] = distance
+                        heapq.heappush(priority_queue, (distance, neighbor))
+
+            for dst, out_weight in out_edges[node].items():
+                if dst == src:
+                    continue
+                via_node = in_weight + out_weight
+                if distances.get(dst, float('infinity')) > via_node:
+                    shortcuts.append((src, dst, via_node))
+        return shortcuts
+
+    def query(self, start_node, end_node):
+        """
+        Query jalur terpendek start_node -> end_node dengan Dijkstra dua arah ke atas.
+        Mengembalikan (jarak, jalur) dengan jalur berformat 'a -> b -> c' (shortcut sudah di-unpack),
+        atau (infinity, None) jika tidak terjangkau.
+        """
+        if start_node not in self.rank or end_node not in self.rank:
+            return float('infinity'), None
+
+        adjacency = (self.upward, self.backward_upward)
+        distances = ({start_node: 0}, {end_node: 0})
+        previous_nodes = ({start_node: None}, {end_node: None})
+        queues = ([(0, start_node)], [(0, end_node)])
+
+        best_distance = float('infinity')
+        meeting_node = None
+
+        while queues[0] or queues[1]:
+            for side in (0, 1):
+                if not queues[side]:
+                    continue
+                current_distance, current_node = heapq.heappop(queues[side])
+                if current_distance > distances[side][current_node]:
+                    continue
+                # Pada CH pencarian satu sisi boleh dihentikan jika sudah melebihi jarak terbaik
+                if current_distance >= best_distance:
+                    queues[side].clear()
+                    continue
+
+                other_distance = distances[1 - side].get(current_node)
+                if other_distance is not None and current_distance + other_distance < best_distance:
+                    best_distance = current_distance + other_distance
+                    meeting_node = current_node
+
+                for neighbor, weight in adjacency[side][current_node].items():
+                    distance = current_distance + weight
+                    if distance < distances[side].get(neighbor, float('infinity')):
+                        distances[side][neighbor] = distance
+                        previous_nodes[side][neighbor] = current_node
+                        heapq.heappush(queues[side], (distance, neighbor))
+
+        if meeting_node is None:
+            return float('infinity'), None
+
+        # Jalur di hierarki: start_node .. meeting_node .. end_node (masih mengandung shortcut)
+        hierarchy_path = []
+        current_node = meeting_node
+        while current_node is not None:
+            hierarchy_path.append(current_node)
+            current_node = previous_nodes[0][current_node]
+        hierarchy_path.reverse()
+        current_node = previous_nodes[1][meeting_node]
+        while current_node is not None:
+            hierarchy_path.append(current_node)
+            current_node = previous_nodes[1][current_node]
+
+        path = [hierarchy_path[0]]
+        for src, dst in zip(hierarchy_path, hierarchy_path[1:]):
+            path.extend(self._unpack_edge(src, dst))
+        return best_distance, ' -> '.join(path)
+
+    def _unpack_edge(self, src, dst):
+        """
+        Menguraikan edge src -> dst (bisa berupa shortcut) menjadi daftar node asli setelah src, diakhiri dst.
+        Memakai stack supaya shortcut yang bertingkat dalam tidak mengenai batas rekursi.
+        """
+        unpacked = []
+        stack = [(src, dst)]
+        while stack:
+            u, v = stack.pop()
+            via = self.middle.get((u, v))
+            if via is None:
+                unpacked.append(v)
+            else:
+                # Urutan push dibalik supaya u -> via diproses lebih dulu
+                stack.append((via, v))
+                stack.append((u, via))
+        return unpacked
@@ -0,0 +1,125 @@
+import heapq
+from array import array
+from collections.abc import Sequence
+
+class CSRGraph:
+    """
+    Representasi graf berarah dalam format Compressed Sparse Row (CSR).
+    Nama node di-intern menjadi id integer (0..V-1), lalu semua edge disimpan
+    di tiga array datar:
+        offsets[i] .. offsets[i + 1]  -> rentang edge yang keluar dari node i
+        targets[j]                    -> id node tujuan dari edge ke-j
+        weights[j]                    -> bobot dari edge ke-j
+    Dengan begini setiap relaksasi cukup membaca indeks array tanpa lookup dictionary.
+    Array boleh berupa array.array (dari from_dict), array NumPy (dari edge_loader), atau memoryview
+    (dari graph_file) selama tipenya sama: offsets int64, targets int32, weights float64.
+    """
+
+    def __init__(self, node_names, offsets, targets, weights):
+        self.node_names = node_names if isinstance(node_names, Sequence) else list(node_names)
+        self._node_index = None
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @property
+    def node_index(self):
+        # Dibuat saat pertama kali dibutuhkan, supaya graf yang dimuat dari file tetap cepat dibuka
+        if self._node_index is None:
+            self._node_index = {name: i for i, name in enumerate(self.node_names)}
+        return self._node_index
+
+    @classmethod
+    def from_dict(cls, graph):
+        """
+        Membuat CSRGraph dari graf dict-of-dicts seperti {'s': {'u': 10}, ...}.
+        Node yang hanya muncul sebagai tujuan edge juga ikut di-intern.
+        """
+        node_names = list(graph)
+        node_index = {name: i for i, name in enumerate(node_names)}
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                if neighbor not in node_index:
+                    node_index[neighbor] = len(node_names)
+                    node_names.append(neighbor)
+
+        offsets = array('q', [0])
+        targets = array('i')
+        weights = array('d')
+        for name in node_names:
+            for neighbor, weight in graph.get(name, {}).items():
+                targets.append(node_index[neighbor])
+                weights.append(weight)
+            offsets.append(len(targets))
+
+        return cls(node_names, offsets, targets, weights)
+
+    def to_dict(self):
+        """
+        Mengembalikan graf ke bentuk dict-of-dicts yang dipakai oleh djikstra.dijkstra.
+        Bobot yang bernilai bulat dikembalikan sebagai int.
+        """
+        graph = {}
+        for i, name in enumerate(self.node_names):
+            neighbors = {}
+            for j in range(self.offsets[i], self.offsets[i + 1]):
+                weight = self.weights[j]
+                neighbors[self.node_names[self.targets[j]]] = int(weight) if weight.is_integer() else weight
+            graph[name] = neighbors
+        return graph
+
+    def num_nodes(self):
+        return len(self.node_names)
+
+    def num_edges(self):
+        return len(self.targets)
+
+    def neighbors(self, node_id):
+        """
+        Generator pasangan (id_tetangga, bobot) dari edge yang keluar dari node_id.
+        """
+        for j in range(self.offsets[node_id], self.offsets[node_id + 1]):
+            yield self.targets[j], self.weights[j]
+
+def dijkstra_csr(csr, start_node):
+    """
+    Varian Dijkstra yang berjalan di atas CSRGraph.
+    start_node boleh berupa nama node atau id integer.
+    Mengembalikan (distances, previous_nodes) berupa array yang diindeks dengan id node:
+    distances berisi float('infinity') untuk node yang tidak terjangkau,
+    previous_nodes berisi -1 untuk node awal dan node yang tidak terjangkau.
+    """
+    start = start_node if isinstance(start_node, int) else csr.node_index[start_node]
+    n = csr.num_nodes()
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+
+    distances = array('d', [float('infinity')]) * n
+    previous_nodes = array('i', [-1]) * n
+    distances[start] = 0
+
+    priority_queue = [(0.0, start)]
+    while priority_queue:
+        current_distance, current_node = heapq.heappop(priority_queue)
+        if current_distance > distances[current_node]:
+            continue
+
+        for j in range(offsets[current_node], offsets[current_node + 1]):
+            neighbor = targets[j]
+            distance = current_distance + weights[j]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous_nodes[neighbor] = current_node
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    return distances, previous_nodes
+
+def get_path_csr(csr, previous_nodes, end_node):
+    """
+    Versi get_path untuk hasil dijkstra_csr, menghasilkan string 'a -> b -> c'.
+    """
+    current_node = end_node if isinstance(end_node, int) else csr.node_index[end_node]
+    path = []
+    while current_node != -1:
+        path.append(csr.node_names[current_node])
+        current_node = previous_nodes[current_node]
+    return ' -> '.join(path[::-1])
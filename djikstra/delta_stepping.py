@@ -0,0 +1,205 @@
+import heapq
+
+import numpy as np
+
+def _csr_arrays(csr):
+    """
+    Mengubah array.array milik CSRGraph menjadi array NumPy tanpa menyalin data.
+    """
+    offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+    targets = np.frombuffer(csr.targets, dtype=np.int32)
+    weights = np.frombuffer(csr.weights, dtype=np.float64)
+    return offsets, targets, weights
+
+def _expand(offsets, nodes):
+    """
+    Mengembalikan (indeks edge, node asal) untuk semua edge yang keluar dari node-node di nodes,
+    dihitung secara vektor tanpa loop Python per node.
+    """
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    sources = np.repeat(nodes, counts)
+    # Indeks edge: starts[i] + 0, 1, ..., counts[i] - 1 untuk setiap node
+    block_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    edge_ids = np.repeat(starts, counts) + (np.arange(total) - block_starts)
+    return edge_ids, sources
+
+def _relax(distances, previous_nodes, edge_ids, sources, targets, weights):
+    """
+    Relaksasi sekumpulan edge sekaligus. Untuk setiap node tujuan diambil kandidat jarak terkecil.
+    Mengembalikan id node yang jaraknya membaik.
+    """
+    if len(edge_ids) == 0:
+        return np.empty(0, dtype=np.int64)
+    destinations = targets[edge_ids].astype(np.int64)
+    candidates = distances[sources] + weights[edge_ids]
+    improving = candidates < distances[destinations]
+    if not improving.any():
+        return np.empty(0, dtype=np.int64)
+    destinations = destinations[improving]
+    candidates = candidates[improving]
+    sources = sources[improving]
+
+    # Jika satu node tujuan punya beberapa kandidat, ambil yang terkecil
+    order = np.lexsort((candidates, destinations))
+    destinations = destinations[order]
+    first = np.ones(len(destinations), dtype=bool)
+    first[1:] = destinations[1:] != destinations[:-1]
+    destinations = destinations[first]
+    distances[destinations] = candidates[order][first]
+    previous_nodes[destinations] = sources[order][first]
+    return destinations
+
+# Bucket yang jumlah edge keluarnya kurang dari ini diproses dengan loop Python biasa: untuk beberapa edge saja,
+# overhead belasan pemanggilan NumPy per fase jauh lebih mahal daripada relaksasinya sendiri
+SMALL_BUCKET_EDGES = 256
+
+def _add_to_buckets(buckets, bucket_heap, bucket_id, nodes):
+    """
+    Menambahkan list nodes ke bucket bucket_id. buckets = {id bucket: list node}, bucket_heap berisi id bucket
+    yang tidak kosong. Entri lama tidak dihapus ketika jarak node membaik; entri itu dibuang saat bucket-nya diambil.
+    """
+    if bucket_id not in buckets:
+        buckets[bucket_id] = nodes
+        heapq.heappush(bucket_heap, bucket_id)
+    else:
+        buckets[bucket_id].extend(nodes)
+
+def _process_bucket_vectorized(bucket_index, frontier, arrays, light, delta, distances, previous_nodes):
+    """
+    Memproses satu bucket dengan relaksasi vektor NumPy. Mengembalikan (bucket_ids, nodes): node-node yang
+    jaraknya membaik ke bucket setelah bucket_index, beserta id bucket barunya.
+    """
+    offsets, targets, weights = arrays
+    later_nodes = []
+    later_buckets = []
+
+    # Fase edge ringan: ulangi selama ada node baru yang masuk ke bucket ini
+    processed = []
+    while len(frontier):
+        processed.append(frontier)
+        edge_ids, sources = _expand(offsets, frontier)
+        keep = light[edge_ids]
+        improved = _relax(distances, previous_nodes, edge_ids[keep], sources[keep], targets, weights)
+        # Node yang membaik dan masih di bucket ini diproses ulang, sisanya masuk ke bucket berikutnya
+        improved_buckets = (distances[improved] // delta).astype(np.int64)
+        in_bucket = improved_buckets == bucket_index
+        frontier = improved[in_bucket]
+        later_nodes.append(improved[~in_bucket])
+        later_buckets.append(improved_buckets[~in_bucket])
+
+    # Fase edge berat: cukup sekali untuk semua node yang sudah di-settle di bucket ini.
+    # Bobot > delta, jadi semua node yang membaik pasti masuk ke bucket setelah bucket ini
+    bucket_nodes = np.unique(np.concatenate(processed))
+    edge_ids, sources = _expand(offsets, bucket_nodes)
+    keep = ~light[edge_ids]
+    improved = _relax(distances, previous_nodes, edge_ids[keep], sources[keep], targets, weights)
+    later_nodes.append(improved)
+    later_buckets.append((distances[improved] // delta).astype(np.int64))
+    return np.concatenate(later_buckets), np.concatenate(later_nodes)
+
+def _process_bucket_small(bucket_index, frontier, csr, delta, distances, previous_nodes):
+    """
+    Sama seperti _process_bucket_vectorized, tetapi dengan loop Python per edge untuk bucket yang kecil.
+    Mengembalikan {id bucket: list node} untuk node-node yang pindah ke bucket setelah bucket_index.
+    """
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    later = {}
+    processed = set()
+    while frontier:
+        next_frontier = set()
+        for u in frontier:
+            processed.add(u)
+            distance_u = distances[u]
+            for j in range(offsets[u], offsets[u + 1]):
+                weight = weights[j]
+                if weight <= delta:
+                    v = targets[j]
+                    distance = distance_u + weight
+                    if distance < distances[v]:
+                        distances[v] = distance
+                        previous_nodes[v] = u
+                        bucket_id = int(distance // delta)
+                        if bucket_id == bucket_index:
+                            next_frontier.add(v)
+                        else:
+                            later.setdefault(bucket_id, []).append(v)
+        frontier = next_frontier
+
+    for u in processed:
+        distance_u = distances[u]
+        for j in range(offsets[u], offsets[u + 1]):
+            weight = weights[j]
+            if weight > delta:
+                v = targets[j]
+                distance = distance_u + weight
+                if distance < distances[v]:
+                    distances[v] = distance
+                    previous_nodes[v] = u
+                    later.setdefault(int(distance // delta), []).append(v)
+    return later
+
+def delta_stepping(csr, start_node, delta=None):
+    """
+    Single-source shortest path dengan algoritma delta-stepping di atas CSRGraph.
+    Node dikelompokkan ke bucket selebar delta; semua node di bucket yang sama diproses serentak,
+    edge ringan (bobot <= delta) direlaksasi berulang sampai bucket stabil, lalu edge berat sekali saja.
+    Setiap fase relaksasi dikerjakan secara vektor dengan NumPy, bukan satu per satu seperti heapq;
+    bucket dengan edge keluar kurang dari SMALL_BUCKET_EDGES diproses dengan loop Python biasa.
+    Isi setiap bucket dicatat saat node-nya membaik, jadi mengambil bucket berikutnya tidak perlu memindai
+    semua V node; biaya per bucket hanya sebanding dengan node dan edge di bucket itu.
+    :param delta: lebar bucket. Default: rata-rata bobot edge (delta kecil mendekati Dijkstra,
+                  delta besar mendekati Bellman-Ford).
+    Mengembalikan (distances, previous_nodes) berupa array NumPy yang diindeks dengan id node
+    (np.inf dan -1 untuk node yang tidak terjangkau), sama seperti dijkstra_csr.
+    """
+    arrays = _csr_arrays(csr)
+    weights = arrays[2]
+    n = csr.num_nodes()
+    start = start_node if isinstance(start_node, int) else csr.node_index[start_node]
+    if delta is None:
+        delta = float(weights.mean()) if len(weights) else 0.0
+        delta = delta or 1.0
+    if delta <= 0:
+        raise ValueError("delta harus lebih besar dari 0")
+
+    distances = np.full(n, np.inf)
+    previous_nodes = np.full(n, -1, dtype=np.int64)
+    distances[start] = 0
+
+    light = weights <= delta
+    # buckets[i] berisi node dengan floor(jarak / delta) == i (bisa berisi entri lama), bucket_heap id bucket-nya
+    buckets = {0: [start]}
+    bucket_heap = [0]
+
+    offsets = csr.offsets
+    while bucket_heap:
+        bucket_index = heapq.heappop(bucket_heap)
+        candidates = buckets.pop(bucket_index)
+
+        if len(candidates) < SMALL_BUCKET_EDGES:
+            # Buang entri lama: node yang jaraknya sudah membaik ke bucket lain yang lebih kecil
+            frontier = {v for v in candidates if distances[v] // delta == bucket_index}
+            if sum(offsets[v + 1] - offsets[v] for v in frontier) < SMALL_BUCKET_EDGES:
+                later = _process_bucket_small(bucket_index, frontier, csr, delta, distances, previous_nodes)
+                for bucket_id, nodes in later.items():
+                    _add_to_buckets(buckets, bucket_heap, bucket_id, nodes)
+                continue
+            frontier = np.array(sorted(frontier), dtype=np.int64)
+        else:
+            candidates = np.unique(np.array(candidates, dtype=np.int64))
+            frontier = candidates[distances[candidates] // delta == bucket_index]
+        if len(frontier) == 0:
+            continue
+        bucket_ids, nodes = _process_bucket_vectorized(bucket_index, frontier, arrays, light, delta, distances, previous_nodes)
+        if len(nodes):
+            order = np.argsort(bucket_ids, kind='stable')
+            bucket_ids = bucket_ids[order]
+            keys, starts = np.unique(bucket_ids, return_index=True)
+            for bucket_id, group in zip(keys.tolist(), np.split(nodes[order], starts[1:])):
+                _add_to_buckets(buckets, bucket_heap, bucket_id, group.tolist())
+
+    return distances, previous_nodes
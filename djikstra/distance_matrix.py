@@ -0,0 +1,67 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from djikstra import choose_queue, dijkstra
+
+# Graf, daftar target, dan jenis queue milik proses worker, diisi sekali oleh _init_worker
+_worker_graph = None
+_worker_targets = None
+_worker_queue = 'auto'
+
+def _init_worker(graph, targets):
+    """
+    Initializer untuk setiap proses worker. Dengan start method 'fork' (default di Linux sampai Python 3.13),
+    graf diwarisi langsung dari proses induk tanpa pickle. Dengan 'spawn' (default di Windows, dan di macOS sejak
+    Python 3.8) atau 'forkserver' (default di Linux sejak Python 3.14), graf di-pickle sekali per worker,
+    bukan per task.
+    """
+    global _worker_graph, _worker_targets, _worker_queue
+    _worker_graph = graph
+    _worker_targets = targets
+    _worker_queue = choose_queue(graph)
+
+def _distance_rows(sources):
+    """
+    Menjalankan dijkstra dari setiap node di sources (di dalam worker) dan mengembalikan
+    baris-baris jarak ke targets dalam bentuk array NumPy.
+    """
+    targets = _worker_targets
+    rows = np.full((len(sources), len(targets)), np.inf)
+    for i, source in enumerate(sources):
+        # Pencarian berhenti begitu semua target sudah di-settle
+        distances, _ = dijkstra(_worker_graph, source, queue=_worker_queue, targets=targets)
+        rows[i] = [distances.get(target, np.inf) for target in targets]
+    return rows
+
+def distance_matrix(graph, sources, targets, max_workers=None, chunk_size=None):
+    """
+    Menghitung matriks jarak terpendek many-to-many dengan menjalankan dijkstra dari setiap node
+    di sources secara paralel menggunakan ProcessPoolExecutor.
+    Mengembalikan matriks NumPy berukuran len(sources) x len(targets); np.inf untuk pasangan yang tidak terjangkau.
+    :param max_workers: jumlah proses worker (default: jumlah CPU). Jika 1, dijalankan serial tanpa proses baru.
+    :param chunk_size: jumlah sumber per task (default: dibagi rata menjadi sekitar 4 task per worker).
+    """
+    sources = list(sources)
+    targets = list(targets)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers == 1 or len(sources) <= 1:
+        _init_worker(graph, targets)
+        return _distance_rows(sources)
+
+    if chunk_size is None:
+        chunk_size = max(1, len(sources) // (max_workers * 4))
+    chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+
+    matrix = np.empty((len(sources), len(targets)))
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(graph, targets)) as executor:
+        futures = [executor.submit(_distance_rows, chunk) for chunk in chunks]
+        row = 0
+        for future in futures:
+            rows = future.result()
+            matrix[row:row + len(rows)] = rows
+            row += len(rows)
+    return matrix
@@ -1,7 +1,90 @@
 import heapq
 import os
 
-def dijkstra(graph, start_node):
+from graph_file import read_graph_file
+from indexed_heap import IndexedHeap
+
+# Batas bobot maksimum agar dijkstra() otomatis memakai bucket queue (Dial)
+DIAL_MAX_WEIGHT = 100
+
+def has_small_integer_weights(graph, max_weight=DIAL_MAX_WEIGHT):
+    """
+    Mengecek apakah semua bobot edge adalah int non-negatif yang tidak lebih dari max_weight.
+    """
+    for neighbors in graph.values():
+        for weight in neighbors.values():
+            if type(weight) is not int or weight < 0 or weight > max_weight:
+                return False
+    return True
+
+def choose_queue(graph, max_bucket_weight=DIAL_MAX_WEIGHT):
+    """
+    Jenis priority queue yang dipilih queue='auto': 'dial' jika semua bobot int non-negatif <= max_bucket_weight,
+    selain itu 'heap'. Butuh satu kali lewat O(E), jadi pemanggil yang menjalankan dijkstra berkali-kali
+    pada graf yang sama sebaiknya memanggil ini sekali lalu meneruskan hasilnya sebagai queue.
+    """
+    return 'dial' if has_small_integer_weights(graph, max_bucket_weight) else 'heap'
+
+class SearchLimit:
+    """
+    Kriteria berhenti lebih awal untuk dijkstra():
+        targets      -> berhenti setelah semua node di targets di-settle
+        max_distance -> berhenti sebelum men-settle node yang jaraknya melebihi max_distance
+        k            -> berhenti setelah k node (termasuk node awal) di-settle
+    Setelah berhenti, node yang belum di-settle dikembalikan ke jarak infinity dan previous None,
+    sehingga distances/previous_nodes hanya berisi hasil final dan tetap bisa dipakai get_path.
+    """
+
+    def __init__(self, targets=None, max_distance=None, k=None):
+        self.remaining_targets = set(targets) if targets is not None else None
+        self.max_distance = max_distance
+        self.k = k
+        self.settled = []
+
+    def exceeds(self, distance):
+        # Dipanggil sebelum node di-settle
+        return self.max_distance is not None and distance > self.max_distance
+
+    def settle(self, node):
+        # Dipanggil setelah node di-settle, True jika pencarian sudah boleh berhenti
+        self.settled.append(node)
+        if self.remaining_targets is not None:
+            self.remaining_targets.discard(node)
+            if not self.remaining_targets:
+                return True
+        return self.k is not None and len(self.settled) >= self.k
+
+    def discard_unsettled(self, distances, previous_nodes):
+        settled = set(self.settled)
+        for node in distances:
+            if node not in settled:
+                distances[node] = float('infinity')
+                previous_nodes[node] = None
+
+def dijkstra(graph, start_node, queue='auto', max_bucket_weight=DIAL_MAX_WEIGHT, targets=None, max_distance=None, k=None):
+    """
+    Algoritma Dijkstra dari start_node, mengembalikan (distances, previous_nodes).
+    targets, max_distance dan k (opsional) menghentikan pencarian lebih awal, lihat SearchLimit.
+    queue menentukan priority queue yang dipakai:
+        'heap' -> min-heap heapq
+        'dial' -> bucket queue (Dial), hanya untuk bobot int non-negatif <= max_bucket_weight
+        'indexed' -> IndexedHeap dengan decrease_key, ukuran heap paling banyak V entri
+        'auto' -> choose_queue(graph): 'dial' jika semua bobot memenuhi syarat di atas, selain itu 'heap'
+                  (memeriksa semua bobot setiap kali dipanggil)
+    """
+    limit = None
+    if targets is not None or max_distance is not None or k is not None:
+        limit = SearchLimit(targets, max_distance, k)
+
+    if queue == 'auto':
+        queue = choose_queue(graph, max_bucket_weight)
+    if queue == 'dial':
+        return dijkstra_dial(graph, start_node, max_bucket_weight, limit)
+    if queue == 'indexed':
+        return dijkstra_indexed(graph, start_node, limit=limit)
+    if queue != 'heap':
+        raise ValueError(f"Jenis priority queue tidak dikenal: {queue}")
+
     # Inisialisasi jarak: 0 untuk node awal, tak terhingga (infinity) untuk lainnya
     distances = {node: float('infinity') for node in graph}
     distances[start_node] = 0
@@ -21,6 +104,10 @@ def dijkstra(graph, start_node):
         if current_distance > distances[current_node]:
             continue
 
+        # Cek kriteria berhenti lebih awal (jika ada)
+        if limit is not None and (limit.exceeds(current_distance) or limit.settle(current_node)):
+            break
+
         # Iterasi melalui tetangga dari node saat ini
         for neighbor, weight in graph[current_node].items():
             distance = current_distance + weight
@@ -33,6 +120,95 @@ def dijkstra(graph, start_node):
                 # Masukkan tetangga ke priority queue dengan jarak barunya
                 heapq.heappush(priority_queue, (distance, neighbor))
 
+    if limit is not None:
+        limit.discard_unsettled(distances, previous_nodes)
+    return distances, previous_nodes
+
+def dijkstra_dial(graph, start_node, max_weight=DIAL_MAX_WEIGHT, limit=None):
+    """
+    Dijkstra dengan bucket queue (algoritma Dial) untuk bobot int non-negatif <= max_weight.
+    Node dengan jarak d disimpan di bucket ke-(d mod (max_weight + 1)); karena semua node yang belum
+    di-settle punya jarak dalam rentang [d_sekarang, d_sekarang + max_weight], bucket melingkar ini cukup.
+    Tidak ada operasi log dan tidak ada tuple (jarak, node) yang dibuat per push.
+    Setiap bobot diperiksa saat edge-nya direlaksasi; ValueError jika ada bobot yang bukan int di [0, max_weight],
+    karena bobot seperti itu membuat bucket melingkar tumpang tindih dan jaraknya salah.
+    """
+    distances = {node: float('infinity') for node in graph}
+    distances[start_node] = 0
+    previous_nodes = {node: None for node in graph}
+
+    num_buckets = max_weight + 1
+    buckets = [[] for _ in range(num_buckets)]
+    buckets[0].append(start_node)
+    # Jumlah entri (termasuk entri basi) yang masih ada di semua bucket
+    pending = 1
+    current_distance = 0
+
+    stopped = False
+    while pending and not stopped:
+        if limit is not None and limit.exceeds(current_distance):
+            break
+        bucket = buckets[current_distance % num_buckets]
+        # Bucket bisa bertambah selama diproses jika ada edge berbobot 0
+        while bucket:
+            current_node = bucket.pop()
+            pending -= 1
+            # Entri basi: node sudah mendapat jarak yang lebih kecil
+            if distances[current_node] != current_distance:
+                continue
+            if limit is not None and limit.settle(current_node):
+                stopped = True
+                break
+
+            for neighbor, weight in graph[current_node].items():
+                if type(weight) is not int or not 0 <= weight <= max_weight:
+                    raise ValueError(f"Bobot edge {current_node} -> {neighbor} ({weight!r}) tidak bisa dipakai bucket queue "
+                                     f"(harus int antara 0 dan {max_weight})")
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    previous_nodes[neighbor] = current_node
+                    buckets[distance % num_buckets].append(neighbor)
+                    pending += 1
+        current_distance += 1
+
+    if limit is not None:
+        limit.discard_unsettled(distances, previous_nodes)
+    return distances, previous_nodes
+
+def dijkstra_indexed(graph, start_node, arity=4, limit=None):
+    """
+    Dijkstra dengan IndexedHeap (decrease_key) sebagai pengganti lazy deletion heapq.
+    Setiap node hanya punya satu entri di heap, sehingga memori priority queue terbatas O(V).
+    """
+    distances = {node: float('infinity') for node in graph}
+    distances[start_node] = 0
+    previous_nodes = {node: None for node in graph}
+
+    # IndexedHeap bekerja dengan id integer, jadi nama node di-intern terlebih dahulu
+    node_names = list(graph)
+    node_index = {node: i for i, node in enumerate(node_names)}
+
+    priority_queue = IndexedHeap(len(node_names), arity)
+    priority_queue.push(node_index[start_node], 0)
+
+    while priority_queue:
+        current_id, _ = priority_queue.pop()
+        current_node = node_names[current_id]
+        current_distance = distances[current_node]
+        if limit is not None and (limit.exceeds(current_distance) or limit.settle(current_node)):
+            break
+
+        for neighbor, weight in graph[current_node].items():
+            distance = current_distance + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous_nodes[neighbor] = current_node
+                # push() otomatis menjadi decrease_key jika neighbor sudah ada di heap
+                priority_queue.push(node_index[neighbor], distance)
+
+    if limit is not None:
+        limit.discard_unsettled(distances, previous_nodes)
     return distances, previous_nodes
 
 def get_path(previous_nodes, start_node, end_node):
@@ -44,6 +220,148 @@ def get_path(previous_nodes, start_node, end_node):
     # Balikkan path karena kita menelusuri dari akhir ke awal
     return ' -> '.join(path[::-1])
 
+class ShortestPathTree:
+    """
+    Pohon jalur terpendek yang dibangun sekali dari previous_nodes hasil dijkstra().
+    Jalur semua node berbagi prefix lewat parent pointer, jadi tidak ada string yang dibuat
+    sampai benar-benar diminta lewat path() atau paths().
+        parent[node]  -> node sebelumnya di jalur (None untuk start_node)
+        depth[node]   -> jumlah edge dari start_node
+        order         -> node terjangkau dalam urutan topologis (preorder DFS dari start_node)
+    """
+
+    def __init__(self, previous_nodes, start_node):
+        self.parent = previous_nodes
+        self.start_node = start_node
+
+        # Daftar anak setiap node, dibangun dalam satu kali lewat
+        self.children = {}
+        for node, parent in previous_nodes.items():
+            if parent is not None:
+                self.children.setdefault(parent, []).append(node)
+
+        self.order = []
+        self.depth = {start_node: 0}
+        stack = [start_node]
+        while stack:
+            node = stack.pop()
+            self.order.append(node)
+            for child in reversed(self.children.get(node, [])):
+                self.depth[child] = self.depth[node] + 1
+                stack.append(child)
+
+    def __contains__(self, node):
+        return node in self.depth
+
+    def path_nodes(self, node):
+        """
+        Daftar node dari start_node ke node, atau None jika node tidak terjangkau.
+        """
+        if node not in self.depth:
+            return None
+        path = [None] * (self.depth[node] + 1)
+        for i in range(self.depth[node], -1, -1):
+            path[i] = node
+            node = self.parent[node]
+        return path
+
+    def path(self, node):
+        """
+        Jalur ke node berformat 'a -> b -> c' seperti get_path, atau None jika node tidak terjangkau.
+        """
+        path = self.path_nodes(node)
+        return ' -> '.join(path) if path is not None else None
+
+    def paths(self):
+        """
+        Generator (node, jalur) untuk semua node terjangkau dalam urutan topologis.
+        String setiap node dibuat dari string parent-nya, dan hanya prefix pada cabang DFS
+        yang sedang aktif yang disimpan, sehingga memori tambahannya sebanding kedalaman pohon.
+        """
+        stack = [(self.start_node, self.start_node)]
+        while stack:
+            node, path = stack.pop()
+            yield node, path
+            for child in reversed(self.children.get(node, [])):
+                stack.append((child, f"{path} -> {child}"))
+
+def build_reverse_graph(graph):
+    """
+    Membuat adjacency terbalik dari graf: setiap edge u -> v menjadi v -> u dengan bobot yang sama.
+    """
+    reverse_graph = {node: {} for node in graph}
+    for src, neighbors in graph.items():
+        for dst, weight in neighbors.items():
+            reverse_graph.setdefault(dst, {})[src] = weight
+    return reverse_graph
+
+def bidirectional_dijkstra(graph, start_node, end_node, reverse_graph=None):
+    """
+    Pencarian jalur terpendek satu pasang (start_node -> end_node) dengan Dijkstra dua arah.
+    Pencarian maju berjalan di graph, pencarian mundur di reverse_graph (dibuat otomatis jika tidak diberikan).
+    Berhenti ketika jumlah jarak terkecil di kedua priority queue >= jarak jalur terbaik yang sudah ditemukan.
+    Mengembalikan (jarak, jalur) dengan jalur berformat 'a -> b -> c', atau (infinity, None) jika tidak terjangkau.
+    """
+    if reverse_graph is None:
+        reverse_graph = build_reverse_graph(graph)
+    if start_node == end_node:
+        return 0, start_node
+
+    # Indeks 0 untuk pencarian maju, indeks 1 untuk pencarian mundur
+    adjacency = (graph, reverse_graph)
+    distances = ({start_node: 0}, {end_node: 0})
+    previous_nodes = ({start_node: None}, {end_node: None})
+    settled = (set(), set())
+    queues = ([(0, start_node)], [(0, end_node)])
+
+    best_distance = float('infinity')
+    # Edge (u, v) yang menyambungkan jalur maju s..u dengan jalur mundur v..t
+    meeting_edge = None
+
+    while queues[0] and queues[1]:
+        # Aturan berhenti: tidak ada jalur lewat node yang belum di-settle yang bisa lebih pendek
+        if queues[0][0][0] + queues[1][0][0] >= best_distance:
+            break
+
+        # Kembangkan sisi yang priority queue-nya lebih kecil
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        current_distance, current_node = heapq.heappop(queues[side])
+        if current_node in settled[side]:
+            continue
+        settled[side].add(current_node)
+
+        for neighbor, weight in adjacency[side].get(current_node, {}).items():
+            distance = current_distance + weight
+            if distance < distances[side].get(neighbor, float('infinity')):
+                distances[side][neighbor] = distance
+                previous_nodes[side][neighbor] = current_node
+                heapq.heappush(queues[side], (distance, neighbor))
+
+            # Cek apakah edge ini menyambungkan kedua pencarian dengan jalur yang lebih pendek
+            other_distance = distances[1 - side].get(neighbor)
+            if other_distance is not None and current_distance + weight + other_distance < best_distance:
+                best_distance = current_distance + weight + other_distance
+                meeting_edge = (current_node, neighbor) if side == 0 else (neighbor, current_node)
+
+    if meeting_edge is None:
+        return float('infinity'), None
+
+    # Jalur dari start_node ke ujung edge penghubung (pencarian maju)
+    path = []
+    current_node = meeting_edge[0]
+    while current_node is not None:
+        path.append(current_node)
+        current_node = previous_nodes[0][current_node]
+    path.reverse()
+
+    # Jalur dari pangkal edge penghubung ke end_node (pencarian mundur)
+    current_node = meeting_edge[1]
+    while current_node is not None:
+        path.append(current_node)
+        current_node = previous_nodes[1][current_node]
+
+    return best_distance, ' -> '.join(path)
+
 def input_graph():
     """
     Meminta input graf dari user.
@@ -97,9 +415,15 @@ if __name__ == "__main__":
     print("Pilih input graf:")
     print("1. Default (graf contoh)")
     print("2. Input manual")
-    pilihan = input("Pilihan (1/2): ")
+    print("3. Muat dari file graf biner (.grf)")
+    pilihan = input("Pilihan (1/2/3): ")
     if pilihan == "2":
         graph = input_graph()
+    elif pilihan == "3":
+        try:
+            graph = read_graph_file(input("Masukkan path file .grf: ").strip()).to_dict()
+        except (OSError, ValueError) as error:
+            raise SystemExit(f"Gagal memuat file graf biner: {error}")
     else:
         graph = {
             's': {'u': 10, 'x': 5},
@@ -111,6 +435,8 @@ if __name__ == "__main__":
 
     start_node = input(f"Masukkan node awal: ") or "s"
     shortest_distances, previous_path_nodes = dijkstra(graph, start_node)
+    # Semua jalur dibentuk sekaligus dengan satu kali penelusuran pohon jalur terpendek
+    shortest_paths = dict(ShortestPathTree(previous_path_nodes, start_node).paths())
 
     print(f"\nHasil Algoritma Dijkstra dari Node '{start_node}':\n")
     print("-" * 50)
@@ -118,7 +444,7 @@ if __name__ == "__main__":
         if distance == float('infinity'):
             print(f"Node '{node}': Tidak dapat dijangkau")
         else:
-            path = get_path(previous_path_nodes, start_node, node)
+            path = shortest_paths[node]
             print(f"Node '{node}':")
             print(f"  -> Jarak Terpendek: {distance}")
             print(f"  -> Jalur: {path}")
@@ -0,0 +1,140 @@
+import heapq
+
+from djikstra import dijkstra, build_reverse_graph
+
+class DynamicShortestPaths:
+    """
+    Single-source shortest path dinamis (gaya Ramalingam-Reps) di atas hasil djikstra.dijkstra.
+    Setelah edge ditambah, dihapus, atau bobotnya diubah, hanya bagian pohon jalur terpendek yang
+    terdampak yang diperbaiki, bukan menjalankan ulang dijkstra() dari awal.
+    graph dimodifikasi langsung oleh method-method di kelas ini, jadi perubahan edge harus lewat kelas ini.
+    """
+
+    def __init__(self, graph, start_node):
+        self.graph = graph
+        self.start_node = start_node
+        self.reverse_graph = build_reverse_graph(graph)
+        self.distances, self.previous_nodes = dijkstra(graph, start_node, queue='heap')
+
+        # Anak-anak setiap node di pohon jalur terpendek, dipakai untuk mencari subtree yang terdampak
+        self.children = {node: set() for node in graph}
+        for node, parent in self.previous_nodes.items():
+            if parent is not None:
+                self.children[parent].add(node)
+
+    def _add_node(self, node):
+        if node not in self.graph:
+            self.graph[node] = {}
+            self.reverse_graph[node] = {}
+            self.distances[node] = float('infinity')
+            self.previous_nodes[node] = None
+            self.children[node] = set()
+
+    def _set_parent(self, node, parent):
+        old_parent = self.previous_nodes[node]
+        if old_parent is not None:
+            self.children[old_parent].discard(node)
+        self.previous_nodes[node] = parent
+        if parent is not None:
+            self.children[parent].add(node)
+
+    def insert_edge(self, u, v, weight):
+        """
+        Menambahkan edge u -> v (atau mengganti bobotnya jika sudah ada).
+        """
+        self.update_edge(u, v, weight)
+
+    def delete_edge(self, u, v):
+        """
+        Menghapus edge u -> v lalu memperbaiki jarak node-node yang sebelumnya melewati edge tersebut.
+        """
+        if v not in self.graph.get(u, {}):
+            return
+        del self.graph[u][v]
+        del self.reverse_graph[v][u]
+        if self.previous_nodes[v] == u:
+            self._repair_increase(v)
+
+    def update_edge(self, u, v, weight):
+        """
+        Mengubah bobot edge u -> v menjadi weight. Edge baru dibuat jika belum ada.
+        """
+        if weight < 0:
+            raise ValueError("Bobot edge tidak boleh negatif")
+        self._add_node(u)
+        self._add_node(v)
+        old_weight = self.graph[u].get(v)
+        self.graph[u][v] = weight
+        self.reverse_graph[v][u] = weight
+
+        if old_weight is None or weight < old_weight:
+            self._repair_decrease(u, v, weight)
+        elif weight > old_weight and self.previous_nodes[v] == u:
+            self._repair_increase(v)
+
+    def _repair_decrease(self, u, v, weight):
+        """
+        Bobot edge u -> v turun: propagasi jarak yang membaik mulai dari v dengan Dijkstra lokal.
+        """
+        distance = self.distances[u] + weight
+        if distance >= self.distances[v]:
+            return
+        self.distances[v] = distance
+        self._set_parent(v, u)
+
+        priority_queue = [(distance, v)]
+        while priority_queue:
+            current_distance, current_node = heapq.heappop(priority_queue)
+            if current_distance > self.distances[current_node]:
+                continue
+            for neighbor, edge_weight in self.graph[current_node].items():
+                distance = current_distance + edge_weight
+                if distance < self.distances[neighbor]:
+                    self.distances[neighbor] = distance
+                    self._set_parent(neighbor, current_node)
+                    heapq.heappush(priority_queue, (distance, neighbor))
+
+    def _repair_increase(self, root):
+        """
+        Edge pohon yang masuk ke root menjadi lebih berat atau dihapus: hanya node di subtree root
+        yang jaraknya mungkin berubah. Jarak node di luar subtree tetap, jadi subtree dihitung ulang
+        dengan Dijkstra yang diinisialisasi dari edge-edge masuk yang berasal dari luar subtree.
+        """
+        # Kumpulkan subtree root di pohon jalur terpendek
+        affected = set()
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            affected.add(node)
+            stack.extend(self.children[node])
+
+        for node in affected:
+            self.distances[node] = float('infinity')
+            self._set_parent(node, None)
+
+        # Jarak awal setiap node terdampak: edge masuk terbaik dari node yang tidak terdampak
+        priority_queue = []
+        for node in affected:
+            for parent, weight in self.reverse_graph[node].items():
+                if parent in affected:
+                    continue
+                distance = self.distances[parent] + weight
+                if distance < self.distances[node]:
+                    self.distances[node] = distance
+                    self._set_parent(node, parent)
+            if self.distances[node] != float('infinity'):
+                priority_queue.append((self.distances[node], node))
+        heapq.heapify(priority_queue)
+
+        while priority_queue:
+            current_distance, current_node = heapq.heappop(priority_queue)
+            if current_distance > self.distances[current_node]:
+                continue
+            for neighbor, weight in self.graph[current_node].items():
+                if neighbor not in affected:
+                    continue
+                distance = current_distance + weight
+                if distance < self.distances[neighbor]:
+                    self.distances[neighbor] = distance
+                    self._set_parent(neighbor, current_node)
+                    heapq.heappush(priority_queue, (distance, neighbor))
@@ -0,0 +1,199 @@
+import io
+import os
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+# Ukuran potongan file (dalam byte) yang dibaca dan di-parse sekaligus
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+
+def _chunk_ranges(filename, chunk_bytes, skip_lines=0):
+    """
+    Membagi file menjadi rentang byte (start, end) berukuran sekitar chunk_bytes yang selalu
+    berakhir tepat setelah karakter newline, sehingga tidak ada baris yang terpotong.
+    skip_lines baris pertama file (misalnya header CSV) tidak masuk ke rentang mana pun.
+    """
+    size = os.path.getsize(filename)
+    ranges = []
+    with open(filename, 'rb') as f:
+        for _ in range(skip_lines):
+            f.readline()
+        start = f.tell()
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def _parse_chunk(filename, start, end, delimiter, comment):
+    """
+    Membaca dan mem-parse satu rentang byte dari file edge list (bisa dijalankan di proses worker).
+    Setiap baris berformat 'asal tujuan [bobot]'; bobot default 1 jika tidak ada.
+    Baris kosong, komentar, baris dengan kurang dari dua kolom, dan baris yang kolom bobotnya bukan angka dilewati.
+    Baris lain selalu dianggap edge, jadi header CSV dua kolom seperti 'source,target' harus dilewati
+    dengan skip_lines pada load_edge_list.
+    Nama node di-intern secara lokal per chunk supaya data yang dikirim balik tetap kecil, dan id/bobot
+    disimpan di array bertipe (8 byte per nilai), bukan list objek Python.
+    Mengembalikan (jumlah_baris, nama_lokal, src_lokal, dst_lokal, bobot) dengan nama_lokal dipisah newline.
+    """
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    # Baris di-parse langsung sebagai bytes dari BytesIO (berbagi buffer dengan data, tanpa salinan), bukan
+    # lewat decode + splitlines() yang membuat salinan teks dan list berisi semua baris. Hanya nama node
+    # yang di-decode, sekali di akhir
+    lines = io.BytesIO(data)
+    if delimiter is not None:
+        delimiter = delimiter.encode('utf-8')
+    if comment:
+        comment = comment.encode('utf-8')
+
+    local_index = {}
+    # setdefault sekaligus mencari dan meng-intern nama dalam satu lookup dictionary
+    intern = local_index.setdefault
+    # Array dialokasikan sekali sebesar jumlah baris (batas atas jumlah edge), lalu diisi per indeks
+    capacity = data.count(b'\n') + 1
+    sources = array('q', bytes(8 * capacity))
+    targets = array('q', bytes(8 * capacity))
+    weights = array('d', bytes(8 * capacity))
+    num_edges = 0
+    num_lines = 0
+    for line in lines:
+        num_lines += 1
+        parts = line.split(delimiter)
+        if len(parts) < 2:
+            continue
+        source = parts[0].strip()
+        if comment and source.startswith(comment):
+            continue
+        try:
+            weight = float(parts[2]) if len(parts) > 2 else 1.0
+        except ValueError:
+            continue
+        sources[num_edges] = intern(source, len(local_index))
+        targets[num_edges] = intern(parts[1].strip(), len(local_index))
+        weights[num_edges] = weight
+        num_edges += 1
+
+    # Nama node dikirim sebagai satu string supaya pickle antar proses tetap murah
+    return (
+        num_lines,
+        b'\n'.join(local_index).decode('utf-8'),
+        np.frombuffer(sources, dtype=np.int64)[:num_edges],
+        np.frombuffer(targets, dtype=np.int64)[:num_edges],
+        np.frombuffer(weights, dtype=np.float64)[:num_edges],
+    )
+
+def _parsed_chunks(filename, ranges, delimiter, comment, workers):
+    """
+    Generator hasil _parse_chunk untuk setiap rentang, berurutan sesuai posisi di file.
+    Dengan workers > 1, chunk di-parse paralel, tetapi paling banyak 2 * workers chunk yang
+    sedang diproses atau menunggu, supaya pemakaian memori tetap terbatas.
+    """
+    if workers <= 1:
+        for start, end in ranges:
+            yield _parse_chunk(filename, start, end, delimiter, comment)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for start, end in ranges:
+            pending.append(executor.submit(_parse_chunk, filename, start, end, delimiter, comment))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def load_edge_list(filename, delimiter=None, comment='#', workers=1, chunk_bytes=DEFAULT_CHUNK_BYTES, verbose=True,
+                   skip_lines=0):
+    """
+    Memuat edge list berarah dari file teks/CSV besar langsung menjadi CSRGraph (siap untuk dijkstra_csr
+    dan delta_stepping) tanpa pernah membuat dict-of-dicts.
+    File dibaca dua kali secara streaming per chunk:
+        1. meng-intern nama node dan menghitung out-degree setiap node  -> array offsets
+        2. menaruh setiap edge langsung di posisinya pada array targets dan weights
+    Selain array CSR hasil akhir (12 byte per edge) dan tabel nama node, memori dipakai oleh chunk yang
+    sedang diproses: byte mentah chunk (chunk_bytes), tiga array 8 byte per baris yang dialokasikan sekali,
+    dan tabel nama lokal chunk (sekitar 100 byte per nama unik). Untuk baris pendek seperti 'u v w' (belasan byte)
+    puncaknya sekitar 4 kali chunk_bytes per chunk, dan bisa sampai sekitar 6-7 kali jika hampir semua nama node
+    di chunk berbeda.
+    Chunk yang diproses bersamaan paling banyak 1 (workers=1) atau 2 * workers.
+    :param delimiter: pemisah kolom; default ',' untuk file .csv dan spasi/tab untuk lainnya.
+    :param skip_lines: jumlah baris di awal file yang dilewati, misalnya 1 untuk file CSV dengan header.
+    :param workers: jumlah proses untuk mem-parse chunk secara paralel.
+    :param verbose: jika True, cetak kemajuan dan kecepatan (baris per detik) setiap chunk.
+    """
+    if delimiter is None and filename.lower().endswith('.csv'):
+        delimiter = ','
+    ranges = _chunk_ranges(filename, chunk_bytes, skip_lines)
+
+    node_index = {}
+    node_names = []
+    degree = np.zeros(0, dtype=np.int64)
+
+    def report(phase, lines, start_time):
+        if verbose:
+            elapsed = time.perf_counter() - start_time
+            rate = lines / elapsed if elapsed > 0 else float('infinity')
+            print(f"[{phase}] {lines:,} baris dibaca ({rate:,.0f} baris/detik)")
+
+    def to_global(joined_names):
+        # Terjemahan id lokal chunk -> id global, meng-intern nama yang baru pertama kali muncul
+        names = joined_names.split('\n') if joined_names else []
+        translation = []
+        for name in names:
+            node_id = node_index.get(name)
+            if node_id is None:
+                node_id = node_index[name] = len(node_names)
+                node_names.append(name)
+            translation.append(node_id)
+        return np.array(translation, dtype=np.int64)
+
+    # Pass 1: intern nama node dan hitung out-degree
+    start_time = time.perf_counter()
+    total_lines = 0
+    for num_lines, names, sources, _, _ in _parsed_chunks(filename, ranges, delimiter, comment, workers):
+        translation = to_global(names)
+        counts = np.bincount(translation[sources], minlength=len(node_names))
+        if len(degree) < len(counts):
+            degree = np.concatenate([degree, np.zeros(len(counts) - len(degree), dtype=np.int64)])
+        degree[:len(counts)] += counts
+        total_lines += num_lines
+        report("1/2", total_lines, start_time)
+
+    degree = np.concatenate([degree, np.zeros(len(node_names) - len(degree), dtype=np.int64)])
+    offsets = np.zeros(len(node_names) + 1, dtype=np.int64)
+    np.cumsum(degree, out=offsets[1:])
+    del degree
+
+    # Pass 2: isi targets dan weights langsung di posisi CSR-nya (urutan edge per node sesuai urutan di file)
+    targets = np.empty(offsets[-1], dtype=np.int32)
+    weights = np.empty(offsets[-1], dtype=np.float64)
+    cursor = offsets[:-1].copy()
+    start_time = time.perf_counter()
+    total_lines = 0
+    for num_lines, names, sources, destinations, chunk_weights in _parsed_chunks(filename, ranges, delimiter, comment, workers):
+        translation = to_global(names)
+        sources = translation[sources]
+        order = np.argsort(sources, kind='stable')
+        sources = sources[order]
+        # Posisi setiap edge = cursor[node asal] + urutannya di antara edge dari node asal yang sama di chunk ini
+        unique_sources, group_starts, group_counts = np.unique(sources, return_index=True, return_counts=True)
+        rank_in_group = np.arange(len(sources)) - np.repeat(group_starts, group_counts)
+        positions = cursor[sources] + rank_in_group
+        targets[positions] = translation[destinations[order]]
+        weights[positions] = chunk_weights[order]
+        cursor[unique_sources] += group_counts
+        total_lines += num_lines
+        report("2/2", total_lines, start_time)
+
+    return CSRGraph(node_names, offsets, targets, weights)
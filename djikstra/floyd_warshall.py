@@ -0,0 +1,115 @@
+import numpy as np
+
+from djikstra import choose_queue, dijkstra
+from distance_matrix import distance_matrix
+
+def weight_matrix(graph):
+    """
+    Membuat matriks bobot NumPy dari graf dict-of-dicts.
+    Mengembalikan (node_names, matrix) dengan matrix[i][j] = bobot edge node_names[i] -> node_names[j],
+    0 pada diagonal, dan np.inf jika tidak ada edge.
+    """
+    node_names = list(graph)
+    node_index = {name: i for i, name in enumerate(node_names)}
+    matrix = np.full((len(node_names), len(node_names)), np.inf)
+    for src, neighbors in graph.items():
+        for dst, weight in neighbors.items():
+            i, j = node_index[src], node_index[dst]
+            matrix[i, j] = min(matrix[i, j], weight)
+    np.fill_diagonal(matrix, np.minimum(matrix.diagonal(), 0))
+    return node_names, matrix
+
+def _update_strip(distances, predecessors, rows, k_start, k_end):
+    """
+    Relaksasi satu strip baris distances[rows, :] lewat node perantara k_start..k_end-1 secara berurutan.
+    Strip selebar block_size baris tetap berada di cache selama semua k di blok diproses.
+    """
+    strip = distances[rows]
+    for k in range(k_start, k_end):
+        candidate = strip[:, k, None] + distances[None, k, :]
+        if predecessors is None:
+            np.minimum(strip, candidate, out=strip)
+            continue
+        improved = candidate < strip
+        if improved.any():
+            strip[improved] = candidate[improved]
+            # Predecessor baru untuk (i, j) adalah predecessor (k, j)
+            predecessors[rows][improved] = np.broadcast_to(predecessors[k], strip.shape)[improved]
+
+def floyd_warshall_matrix(weights, block_size=64, track_predecessors=False):
+    """
+    Floyd-Warshall ber-tile (blocked) pada matriks bobot NumPy.
+    Node perantara diproses per blok selebar block_size. Untuk setiap blok, strip baris milik blok itu
+    sendiri diselesaikan lebih dulu (blok diagonal + panel baris), lalu strip-strip baris lainnya memakai
+    panel baris yang sudah final. Setiap relaksasi adalah operasi NumPy ber-vektor pada satu strip.
+    Mengembalikan (distances, predecessors); predecessors[i][j] adalah node sebelum j pada jalur i -> j
+    (-1 jika tidak ada), atau None jika track_predecessors False.
+    """
+    distances = np.array(weights, dtype=np.float64)
+    n = distances.shape[0]
+    predecessors = None
+    if track_predecessors:
+        predecessors = np.where(np.isfinite(distances), np.arange(n)[:, None], -1)
+        np.fill_diagonal(predecessors, -1)
+
+    for k_start in range(0, n, block_size):
+        k_end = min(k_start + block_size, n)
+
+        # Strip baris dari blok k: blok diagonal dan panel baris
+        _update_strip(distances, predecessors, slice(k_start, k_end), k_start, k_end)
+
+        # Strip-strip baris lainnya
+        for i_start in range(0, n, block_size):
+            if i_start != k_start:
+                rows = slice(i_start, min(i_start + block_size, n))
+                _update_strip(distances, predecessors, rows, k_start, k_end)
+
+    return distances, predecessors
+
+def floyd_warshall(graph, block_size=64, track_predecessors=False):
+    """
+    Floyd-Warshall ber-tile untuk graf dict-of-dicts.
+    Mengembalikan (node_names, distances, predecessors) dengan baris/kolom matriks sesuai urutan node_names.
+    """
+    node_names, weights = weight_matrix(graph)
+    distances, predecessors = floyd_warshall_matrix(weights, block_size, track_predecessors)
+    return node_names, distances, predecessors
+
+def _repeated_dijkstra(graph, track_predecessors):
+    node_names = list(graph)
+    if not track_predecessors:
+        return node_names, distance_matrix(graph, node_names, node_names), None
+
+    node_index = {name: i for i, name in enumerate(node_names)}
+    n = len(node_names)
+    distances = np.full((n, n), np.inf)
+    predecessors = np.full((n, n), -1)
+    # Jenis queue ditentukan sekali untuk semua sumber, bukan di setiap pemanggilan dijkstra
+    queue = choose_queue(graph)
+    for i, source in enumerate(node_names):
+        source_distances, previous_nodes = dijkstra(graph, source, queue=queue)
+        for j, target in enumerate(node_names):
+            distances[i, j] = source_distances[target]
+            if previous_nodes[target] is not None:
+                predecessors[i, j] = node_index[previous_nodes[target]]
+    return node_names, distances, predecessors
+
+def all_pairs_shortest_paths(graph, method='auto', density_threshold=0.1, track_predecessors=False):
+    """
+    All-pairs shortest path dengan pilihan metode:
+        'floyd_warshall' -> Floyd-Warshall ber-tile dengan NumPy, O(V^3) tetapi ber-vektor
+        'dijkstra'       -> dijkstra dari setiap node (paralel lewat distance_matrix), O(V * E log V)
+        'auto'           -> floyd_warshall jika kepadatan E / (V * (V - 1)) >= density_threshold
+    Mengembalikan (node_names, distances, predecessors) seperti floyd_warshall().
+    """
+    if method == 'auto':
+        num_nodes = len(graph)
+        num_edges = sum(len(neighbors) for neighbors in graph.values())
+        density = num_edges / (num_nodes * (num_nodes - 1)) if num_nodes > 1 else 1.0
+        method = 'floyd_warshall' if density >= density_threshold else 'dijkstra'
+
+    if method == 'floyd_warshall':
+        return floyd_warshall(graph, track_predecessors=track_predecessors)
+    if method == 'dijkstra':
+        return _repeated_dijkstra(graph, track_predecessors)
+    raise ValueError(f"Metode all-pairs shortest path tidak dikenal: {method}")
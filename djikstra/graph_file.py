@@ -0,0 +1,134 @@
+"""
+Format file graf biner (.grf) yang bisa dibuka dengan mmap tanpa menyalin data.
+Semua angka little-endian dan setiap bagian dimulai di posisi kelipatan 8 byte:
+
+    header (64 byte)  : magic b'DAAGRAF1', versi (uint32), cadangan (uint32),
+                        jumlah node V (uint64), jumlah edge E (uint64), panjang tabel nama (uint64)
+    name_offsets      : uint64[V + 1], posisi awal/akhir nama node ke-i di tabel nama
+    tabel nama        : nama-nama node dalam UTF-8 yang disambung tanpa pemisah
+    offsets           : int64[V + 1]   (sama seperti CSRGraph.offsets)
+    targets           : int32[E]       (sama seperti CSRGraph.targets)
+    weights           : float64[E]     (sama seperti CSRGraph.weights)
+
+Karena file dibaca lewat mmap, banyak proses yang membuka file yang sama akan berbagi page cache yang sama.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+from csr_graph import CSRGraph
+
+MAGIC = b'DAAGRAF1'
+VERSION = 1
+HEADER_FORMAT = '<8sIIQQQ'
+HEADER_SIZE = 64
+
+def _padding(size):
+    return -size % 8
+
+class _NameTable(Sequence):
+    """
+    Daftar nama node yang dibaca langsung dari buffer mmap; nama baru di-decode saat diakses.
+    """
+
+    def __init__(self, name_offsets, names_blob):
+        self.name_offsets = name_offsets
+        self.names_blob = names_blob
+
+    def __len__(self):
+        return len(self.name_offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return bytes(self.names_blob[self.name_offsets[i]:self.name_offsets[i + 1]]).decode('utf-8')
+
+def _to_bytes(typecode, values):
+    """
+    Mengubah array CSR (array.array, NumPy, atau memoryview) menjadi bytes dengan tipe elemen typecode.
+    Array yang tipenya sudah cocok disalin apa adanya tanpa iterasi per elemen.
+    """
+    data = memoryview(values)
+    is_float = data.format[-1] in 'fd'
+    if data.itemsize != array(typecode).itemsize or is_float != (typecode == 'd'):
+        data = memoryview(array(typecode, values))
+    return data.tobytes()
+
+def write_graph_file(filename, csr):
+    """
+    Menulis CSRGraph ke file biner .grf.
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("File graf biner hanya bisa ditulis di mesin little-endian")
+    encoded_names = [str(name).encode('utf-8') for name in csr.node_names]
+    name_offsets = array('Q', [0])
+    for name in encoded_names:
+        name_offsets.append(name_offsets[-1] + len(name))
+    names_blob = b''.join(encoded_names)
+
+    num_nodes = len(encoded_names)
+    num_edges = csr.num_edges()
+    with open(filename, 'wb') as f:
+        header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, 0, num_nodes, num_edges, len(names_blob))
+        f.write(header + b'\0' * (HEADER_SIZE - len(header)))
+        for section in (
+            _to_bytes('Q', name_offsets),
+            names_blob,
+            _to_bytes('q', csr.offsets),
+            _to_bytes('i', csr.targets),
+            _to_bytes('d', csr.weights),
+        ):
+            f.write(section)
+            f.write(b'\0' * _padding(len(section)))
+
+def read_graph_file(filename):
+    """
+    Membuka file .grf lewat mmap dan mengembalikan CSRGraph yang array-nya berupa memoryview
+    langsung ke halaman file (zero-copy). Waktu buka tidak bergantung pada ukuran graf.
+    ValueError jika file bukan file .grf, lebih pendek dari header, atau terpotong (lebih pendek dari
+    ukuran semua bagian yang dinyatakan di header).
+    """
+    with open(filename, 'rb') as f:
+        # mmap tidak bisa memetakan file 0 byte, jadi file yang terlalu pendek ditolak sebelum dipetakan
+        if os.fstat(f.fileno()).st_size < HEADER_SIZE:
+            raise ValueError(f"'{filename}' bukan file graf biner (.grf): ukurannya lebih kecil dari header")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, _, num_nodes, num_edges, names_size = struct.unpack_from(HEADER_FORMAT, buffer, 0)
+    if magic != MAGIC:
+        raise ValueError(f"'{filename}' bukan file graf biner (.grf)")
+    if version != VERSION:
+        raise ValueError(f"Versi file graf {version} tidak didukung")
+    if sys.byteorder != 'little':
+        raise ValueError("File graf biner hanya bisa dibuka di mesin little-endian")
+
+    section_sizes = (8 * (num_nodes + 1), names_size, 8 * (num_nodes + 1), 4 * num_edges, 8 * num_edges)
+    expected_size = HEADER_SIZE + sum(size + _padding(size) for size in section_sizes)
+    if len(buffer) < expected_size:
+        raise ValueError(f"File graf '{filename}' terpotong: ukurannya {len(buffer)} byte, "
+                         f"header menyatakan {num_nodes} node dan {num_edges} edge ({expected_size} byte)")
+
+    view = memoryview(buffer)
+    position = HEADER_SIZE
+
+    def section(size):
+        nonlocal position
+        start = position
+        position += size + _padding(size)
+        return view[start:start + size]
+
+    name_offsets = section(8 * (num_nodes + 1)).cast('Q')
+    names_blob = section(names_size)
+    offsets = section(8 * (num_nodes + 1)).cast('q')
+    targets = section(4 * num_edges).cast('i')
+    weights = section(8 * num_edges).cast('d')
+
+    return CSRGraph(_NameTable(name_offsets, names_blob), offsets, targets, weights)
@@ -0,0 +1,120 @@
+from array import array
+
+class IndexedHeap:
+    """
+    Min-heap d-ary ber-indeks untuk item berupa id integer 0..capacity-1, lengkap dengan decrease_key.
+    Semua data disimpan di array datar:
+        heap[p]      -> id item di posisi p
+        keys[p]      -> prioritas item di posisi p
+        position[i]  -> posisi item i di heap (-1 jika tidak ada di heap)
+    Karena setiap item paling banyak muncul sekali, ukuran heap tidak pernah melebihi capacity
+    (berbeda dengan lazy deletion di heapq yang bisa menumpuk entri basi sampai O(E)).
+    """
+
+    def __init__(self, capacity, arity=2):
+        if arity < 2:
+            raise ValueError("Arity heap minimal 2")
+        self.arity = arity
+        self.size = 0
+        self.heap = array('i', [0]) * capacity
+        self.keys = array('d', [0.0]) * capacity
+        self.position = array('i', [-1]) * capacity
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, item):
+        return self.position[item] != -1
+
+    def _position_of(self, item):
+        # position[item] == -1 akan diam-diam menunjuk ke slot terakhir array, jadi harus ditolak di sini
+        p = self.position[item]
+        if p == -1:
+            raise KeyError(item)
+        return p
+
+    def key_of(self, item):
+        """
+        Prioritas item yang sedang ada di heap. KeyError jika item tidak ada di heap.
+        """
+        return self.keys[self._position_of(item)]
+
+    def push(self, item, key):
+        """
+        Memasukkan item baru ke heap. Jika item sudah ada, prioritasnya diturunkan (jika lebih kecil).
+        """
+        if self.position[item] != -1:
+            self.decrease_key(item, key)
+            return
+        self.heap[self.size] = item
+        self.keys[self.size] = key
+        self.position[item] = self.size
+        self.size += 1
+        self._sift_up(self.size - 1)
+
+    def decrease_key(self, item, key):
+        """
+        Menurunkan prioritas item yang sudah ada di heap. Prioritas yang tidak lebih kecil diabaikan.
+        KeyError jika item tidak ada di heap.
+        """
+        p = self._position_of(item)
+        if key < self.keys[p]:
+            self.keys[p] = key
+            self._sift_up(p)
+
+    def pop(self):
+        """
+        Mengambil item dengan prioritas terkecil, mengembalikan (item, key).
+        """
+        if self.size == 0:
+            raise IndexError("pop dari heap kosong")
+        item = self.heap[0]
+        key = self.keys[0]
+        self.position[item] = -1
+        self.size -= 1
+        if self.size:
+            last = self.heap[self.size]
+            self.heap[0] = last
+            self.keys[0] = self.keys[self.size]
+            self.position[last] = 0
+            self._sift_down(0)
+        return item, key
+
+    def _sift_up(self, p):
+        heap, keys, position, arity = self.heap, self.keys, self.position, self.arity
+        item = heap[p]
+        key = keys[p]
+        while p > 0:
+            parent = (p - 1) // arity
+            if keys[parent] <= key:
+                break
+            heap[p] = heap[parent]
+            keys[p] = keys[parent]
+            position[heap[p]] = p
+            p = parent
+        heap[p] = item
+        keys[p] = key
+        position[item] = p
+
+    def _sift_down(self, p):
+        heap, keys, position, arity, size = self.heap, self.keys, self.position, self.arity, self.size
+        item = heap[p]
+        key = keys[p]
+        while True:
+            first_child = p * arity + 1
+            if first_child >= size:
+                break
+            # Cari anak dengan prioritas terkecil
+            best = first_child
+            for child in range(first_child + 1, min(first_child + arity, size)):
+                if keys[child] < keys[best]:
+                    best = child
+            if keys[best] >= key:
+                break
+            heap[p] = heap[best]
+            keys[p] = keys[best]
+            position[heap[p]] = p
+            p = best
+        heap[p] = item
+        keys[p] = key
+        position[item] = p
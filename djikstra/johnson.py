@@ -0,0 +1,92 @@
+from collections import deque
+
+from djikstra import choose_queue, dijkstra
+
+class NegativeCycleError(ValueError):
+    """
+    Dilempar jika graf memiliki siklus berbobot negatif, sehingga jarak terpendek tidak terdefinisi.
+    """
+
+def spfa(graph, start_node=None):
+    """
+    Bellman-Ford berbasis queue (Shortest Path Faster Algorithm) yang mendukung bobot negatif.
+    Jika start_node None, semua node dimulai dengan jarak 0 (setara dengan menambahkan node sumber
+    virtual yang terhubung ke semua node dengan bobot 0, seperti pada algoritma Johnson).
+    Mengembalikan (distances, previous_nodes), atau melempar NegativeCycleError jika ada siklus negatif
+    yang terjangkau dari sumber.
+    """
+    distances = {node: float('infinity') for node in graph}
+    previous_nodes = {node: None for node in graph}
+    # Jumlah edge pada jalur terbaik saat ini; jika mencapai V berarti jalurnya mengandung siklus negatif
+    path_length = {node: 0 for node in graph}
+
+    if start_node is None:
+        queue = deque(graph)
+        for node in graph:
+            distances[node] = 0
+    else:
+        queue = deque([start_node])
+        distances[start_node] = 0
+    in_queue = set(queue)
+
+    num_nodes = len(graph)
+    while queue:
+        current_node = queue.popleft()
+        in_queue.discard(current_node)
+        current_distance = distances[current_node]
+
+        for neighbor, weight in graph[current_node].items():
+            distance = current_distance + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous_nodes[neighbor] = current_node
+                path_length[neighbor] = path_length[current_node] + 1
+                if path_length[neighbor] >= num_nodes:
+                    raise NegativeCycleError(f"Graf memiliki siklus berbobot negatif yang melewati node '{neighbor}'")
+                if neighbor not in in_queue:
+                    queue.append(neighbor)
+                    in_queue.add(neighbor)
+
+    return distances, previous_nodes
+
+class Johnson:
+    """
+    Algoritma Johnson untuk shortest path pada graf dengan bobot negatif (tanpa siklus negatif).
+    Potensial h(v) dihitung sekali dengan SPFA, lalu setiap edge diberi bobot baru
+        w'(u, v) = w(u, v) + h(u) - h(v) >= 0
+    sehingga djikstra.dijkstra bisa dipakai ulang untuk setiap query. Potensial dan graf hasil
+    reweighting disimpan di objek ini, jadi query berikutnya tidak perlu menghitung ulang.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.potentials, _ = spfa(graph)
+
+        self.reweighted_graph = {}
+        for src, neighbors in graph.items():
+            self.reweighted_graph[src] = {
+                # max() hanya untuk membuang galat pembulatan floating point di sekitar 0
+                dst: max(0, weight + self.potentials[src] - self.potentials[dst])
+                for dst, weight in neighbors.items()
+            }
+        # Jenis queue untuk graf hasil reweighting ditentukan sekali untuk semua query
+        self.queue = choose_queue(self.reweighted_graph)
+
+    def dijkstra(self, start_node):
+        """
+        Shortest path dari start_node dengan bobot asli. Mengembalikan (distances, previous_nodes)
+        dengan format yang sama seperti djikstra.dijkstra, jadi tetap bisa dipakai bersama get_path.
+        """
+        reweighted_distances, previous_nodes = dijkstra(self.reweighted_graph, start_node, queue=self.queue)
+        start_potential = self.potentials[start_node]
+        distances = {
+            node: distance - start_potential + self.potentials[node] if distance != float('infinity') else distance
+            for node, distance in reweighted_distances.items()
+        }
+        return distances, previous_nodes
+
+    def all_pairs(self):
+        """
+        Jarak terpendek untuk semua pasangan node dalam bentuk dict: hasil[u][v] = jarak u -> v.
+        """
+        return {node: self.dijkstra(node)[0] for node in self.graph}
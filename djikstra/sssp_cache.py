@@ -0,0 +1,111 @@
+import sys
+from collections import OrderedDict
+
+from djikstra import DIAL_MAX_WEIGHT, choose_queue, dijkstra
+
+# Batas default total ukuran hasil yang disimpan di cache (byte)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+class ShortestPathCache:
+    """
+    Cache hasil dijkstra(graph, start_node) per node awal, dengan LRU berbasis perkiraan memori.
+    Setiap hasil disimpan dengan key (start_node, versi graf). Semua perubahan graf harus lewat
+    update_edge/remove_edge/add_node (atau invalidate() setelah mengubah graph secara langsung),
+    yang menaikkan versi dan membuang semua hasil lama.
+    Hasil yang dikembalikan adalah objek yang sama dengan yang disimpan di cache, jadi jangan diubah.
+    """
+
+    def __init__(self, graph, max_bytes=DEFAULT_MAX_BYTES, **dijkstra_options):
+        self.graph = graph
+        self.max_bytes = max_bytes
+        # Opsi tambahan yang diteruskan ke dijkstra(), misalnya queue='indexed'
+        self.dijkstra_options = dijkstra_options
+        # Jenis queue untuk queue='auto' ditentukan sekali per versi graf, bukan di setiap cache miss
+        self._queue = None
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._total_bytes = 0
+
+    @staticmethod
+    def _estimate_size(result):
+        distances, previous_nodes = result
+        return sys.getsizeof(distances) + sys.getsizeof(previous_nodes)
+
+    def dijkstra(self, start_node):
+        """
+        Sama seperti djikstra.dijkstra(graph, start_node), tetapi hasilnya diambil dari cache jika ada.
+        """
+        key = (start_node, self.version)
+        result = self._entries.get(key)
+        if result is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return result
+
+        self.misses += 1
+        options = self.dijkstra_options
+        if options.get('queue', 'auto') == 'auto':
+            if self._queue is None:
+                self._queue = choose_queue(self.graph, options.get('max_bucket_weight', DIAL_MAX_WEIGHT))
+            options = {**options, 'queue': self._queue}
+        result = dijkstra(self.graph, start_node, **options)
+        size = self._estimate_size(result)
+        if size > self.max_bytes:
+            # Hasil yang lebih besar dari seluruh kapasitas cache tidak disimpan
+            return result
+
+        self._entries[key] = result
+        self._sizes[key] = size
+        self._total_bytes += size
+        while self._total_bytes > self.max_bytes:
+            old_key, _ = self._entries.popitem(last=False)
+            self._total_bytes -= self._sizes.pop(old_key)
+            self.evictions += 1
+        return result
+
+    def invalidate(self):
+        """
+        Menaikkan versi graf dan membuang semua hasil yang tersimpan.
+        """
+        self.version += 1
+        self._queue = None
+        self._entries.clear()
+        self._sizes.clear()
+        self._total_bytes = 0
+
+    def add_node(self, node):
+        if node not in self.graph:
+            self.graph[node] = {}
+            self.invalidate()
+
+    def update_edge(self, u, v, weight):
+        """
+        Menambahkan edge u -> v atau mengubah bobotnya.
+        """
+        if self.graph.get(u, {}).get(v) == weight:
+            return
+        self.graph.setdefault(u, {})[v] = weight
+        self.graph.setdefault(v, {})
+        self.invalidate()
+
+    def remove_edge(self, u, v):
+        if v in self.graph.get(u, {}):
+            del self.graph[u][v]
+            self.invalidate()
+
+    def cache_info(self):
+        """
+        Statistik cache: jumlah hit, miss, eviksi, jumlah hasil tersimpan, dan perkiraan memorinya.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self._total_bytes,
+            'version': self.version,
+        }
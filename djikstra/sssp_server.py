@@ -0,0 +1,219 @@
+"""
+Server query jalur terpendek berbasis asyncio yang memuat satu graf di memori.
+Protokol: TCP, satu objek JSON per baris (JSON Lines). Contoh request dan response:
+
+    {"source": "s", "target": "y"}   -> {"source": "s", "target": "y", "distance": 7, "path": "s -> x -> y"}
+    {"source": "s"}                  -> {"source": "s", "distances": {"s": 0, "u": 8, ...}}
+    {"type": "metrics"}              -> {"count": ..., "p50_ms": ..., "p99_ms": ...}
+
+Query yang datang berdekatan dikumpulkan menjadi satu batch (dikelompokkan per node sumber supaya
+setiap sumber cukup dijalankan dijkstra sekali), lalu dikerjakan di process pool.
+
+Cara menjalankan: python sssp_server.py [file.grf] [--port 8765] [--workers N]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from djikstra import choose_queue, dijkstra, get_path
+from graph_file import read_graph_file
+
+DEFAULT_GRAPH = {
+    's': {'u': 10, 'x': 5},
+    'u': {'v': 1, 'x': 2},
+    'v': {'y': 4},
+    'x': {'u': 3, 'v': 9, 'y': 2},
+    'y': {'s': 7, 'v': 6}
+}
+
+# Graf dan jenis queue milik proses worker, diisi sekali oleh _init_worker
+_worker_graph = None
+_worker_queue = 'auto'
+
+def _init_worker(graph):
+    global _worker_graph, _worker_queue
+    _worker_graph = graph
+    _worker_queue = choose_queue(graph)
+
+def _solve_batch(queries):
+    """
+    Menjawab sekumpulan query (source, target) di proses worker. target None berarti semua jarak.
+    Query dengan source yang sama hanya menjalankan dijkstra sekali.
+    """
+    by_source = {}
+    for source, target in queries:
+        by_source.setdefault(source, set()).add(target)
+
+    answers = {}
+    for source, targets in by_source.items():
+        # Kesalahan pada satu sumber hanya menggagalkan query dari sumber itu, bukan seluruh batch
+        try:
+            answers.update(_solve_source(source, targets))
+        except Exception as exception:
+            for target in targets:
+                answers[(source, target)] = {'source': source, 'target': target, 'error': str(exception)}
+    return [answers[query] for query in queries]
+
+def _solve_source(source, targets):
+    """
+    Menjawab semua query dari satu node sumber dengan satu kali dijkstra.
+    """
+    answers = {}
+    if source not in _worker_graph:
+        for target in targets:
+            answers[(source, target)] = {'source': source, 'error': f"Node '{source}' tidak ada di graf"}
+        return answers
+
+    # Jika semua query dari sumber ini punya target, pencarian boleh berhenti lebih awal
+    early_targets = None if None in targets else [target for target in targets if target in _worker_graph]
+    distances, previous_nodes = dijkstra(_worker_graph, source, queue=_worker_queue, targets=early_targets)
+    for target in targets:
+        if target is None:
+            answers[(source, target)] = {
+                'source': source,
+                'distances': {node: distance for node, distance in distances.items() if distance != float('infinity')},
+            }
+        elif target not in distances:
+            answers[(source, target)] = {'source': source, 'target': target, 'error': f"Node '{target}' tidak ada di graf"}
+        elif distances[target] == float('infinity'):
+            answers[(source, target)] = {'source': source, 'target': target, 'distance': None, 'path': None}
+        else:
+            answers[(source, target)] = {
+                'source': source,
+                'target': target,
+                'distance': distances[target],
+                'path': get_path(previous_nodes, source, target),
+            }
+    return answers
+
+class LatencyMetrics:
+    """
+    Menyimpan latensi dari request-request terakhir dan menghitung persentilnya.
+    """
+
+    def __init__(self, window=10000):
+        self.latencies = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds):
+        self.latencies.append(seconds)
+        self.count += 1
+
+    def percentile(self, p):
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))
+        return ordered[index] * 1000
+
+    def snapshot(self):
+        return {'count': self.count, 'p50_ms': self.percentile(50), 'p99_ms': self.percentile(99)}
+
+class ShortestPathServer:
+    """
+    Server TCP JSON Lines untuk query dijkstra/get_path pada satu graf yang dimuat sekali.
+    """
+
+    def __init__(self, graph, workers=None, batch_size=64, batch_window=0.002):
+        self.graph = graph
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        # Waktu tunggu maksimum (detik) untuk mengumpulkan query sebelum batch dikirim ke pool
+        self.batch_window = batch_window
+        self.metrics = LatencyMetrics()
+        self.executor = None
+        self.pending = None
+        # Referensi ke task batch yang sedang berjalan, supaya tidak dibuang oleh garbage collector
+        self._batch_tasks = set()
+
+    async def _batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.pending.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.pending.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            task = loop.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        queries = [query for query, _ in batch]
+        try:
+            answers = await loop.run_in_executor(self.executor, _solve_batch, queries)
+        except Exception as exception:
+            answers = [{'error': str(exception)}] * len(batch)
+        for (_, future), answer in zip(batch, answers):
+            if not future.done():
+                future.set_result(answer)
+
+    async def query(self, source, target=None):
+        """
+        Memasukkan satu query ke antrean batch dan menunggu jawabannya.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.pending.put(((source, target), future))
+        return await future
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                start_time = time.perf_counter()
+                try:
+                    request = json.loads(line)
+                    if request.get('type') == 'metrics':
+                        response = self.metrics.snapshot()
+                    elif not isinstance(request['source'], str) or not isinstance(request.get('target', ''), (str, type(None))):
+                        response = {'error': "Request tidak valid: 'source' dan 'target' harus berupa string"}
+                    else:
+                        response = await self.query(request['source'], request.get('target'))
+                        self.metrics.record(time.perf_counter() - start_time)
+                except (ValueError, KeyError, AttributeError) as exception:
+                    response = {'error': f"Request tidak valid: {exception}"}
+                writer.write((json.dumps(response) + '\n').encode('utf-8'))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        self.pending = asyncio.Queue()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(self.graph,)) as executor:
+            self.executor = executor
+            batcher = asyncio.create_task(self._batcher())
+            server = await asyncio.start_server(self._handle_client, host, port)
+            print(f"Server jalur terpendek berjalan di {host}:{port} ({len(self.graph)} node, {self.workers} worker)")
+            try:
+                async with server:
+                    await server.serve_forever()
+            finally:
+                batcher.cancel()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server query jalur terpendek (Dijkstra) berbasis asyncio")
+    parser.add_argument("graph_file", nargs="?", help="file graf biner .grf (default: graf contoh)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    graph = read_graph_file(args.graph_file).to_dict() if args.graph_file else DEFAULT_GRAPH
+    try:
+        asyncio.run(ShortestPathServer(graph, workers=args.workers).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nServer dihentikan.")
@@ -0,0 +1,119 @@
+import heapq
+from collections.abc import Mapping
+
+from djikstra import choose_queue, dijkstra
+
+class _MaskedNeighbors(Mapping):
+    """
+    View tetangga dari satu node yang menyembunyikan edge/node yang sedang di-mask, tanpa menyalin dict aslinya.
+    """
+
+    def __init__(self, node, neighbors, masked_nodes, masked_edges):
+        self.node = node
+        self.neighbors = neighbors
+        self.masked_nodes = masked_nodes
+        self.masked_edges = masked_edges
+
+    def _visible(self, neighbor):
+        return neighbor not in self.masked_nodes and (self.node, neighbor) not in self.masked_edges
+
+    def __getitem__(self, neighbor):
+        if not self._visible(neighbor):
+            raise KeyError(neighbor)
+        return self.neighbors[neighbor]
+
+    def __iter__(self):
+        for neighbor in self.neighbors:
+            if self._visible(neighbor):
+                yield neighbor
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+class MaskedGraph(Mapping):
+    """
+    View dari graf dict-of-dicts dengan sebagian node dan edge disembunyikan sementara.
+    Node yang di-mask tetap ada sebagai key (supaya dijkstra tetap menginisialisasi jaraknya),
+    tetapi semua edge yang masuk atau keluar darinya tidak terlihat.
+    """
+
+    def __init__(self, graph, masked_nodes=(), masked_edges=()):
+        self.graph = graph
+        self.masked_nodes = set(masked_nodes)
+        self.masked_edges = set(masked_edges)
+
+    def __getitem__(self, node):
+        if node in self.masked_nodes:
+            return {}
+        return _MaskedNeighbors(node, self.graph[node], self.masked_nodes, self.masked_edges)
+
+    def __iter__(self):
+        return iter(self.graph)
+
+    def __len__(self):
+        return len(self.graph)
+
+def _path_cost(graph, path):
+    return sum(graph[u][v] for u, v in zip(path, path[1:]))
+
+def _shortest_path(graph, start_node, end_node, queue='auto'):
+    """
+    Jalur terpendek start_node -> end_node sebagai list node, atau None jika tidak terjangkau.
+    """
+    distances, previous_nodes = dijkstra(graph, start_node, queue=queue, targets=[end_node])
+    if distances[end_node] == float('infinity'):
+        return None
+    path = []
+    current_node = end_node
+    while current_node is not None:
+        path.append(current_node)
+        current_node = previous_nodes[current_node]
+    return path[::-1]
+
+def k_shortest_paths(graph, start_node, end_node, k=None):
+    """
+    Generator k jalur terpendek tanpa loop (loopless) dari start_node ke end_node dengan algoritma Yen.
+    Menghasilkan (jarak, jalur) berurutan dari yang terpendek, dengan jalur berformat 'a -> b -> c'.
+    Jalur dihasilkan satu per satu (lazy), jadi pemanggil bisa berhenti kapan saja; jika k None,
+    generator berjalan sampai semua jalur habis.
+    Setiap spur search memakai dijkstra pada MaskedGraph, bukan salinan dari graph.
+    """
+    # MaskedGraph hanya menyembunyikan edge, jadi jenis queue untuk graph berlaku juga untuk semua spur search
+    queue = choose_queue(graph)
+    first_path = _shortest_path(graph, start_node, end_node, queue)
+    if first_path is None:
+        return
+
+    shortest_paths = [first_path]
+    yield _path_cost(graph, first_path), ' -> '.join(first_path)
+
+    # Kandidat jalur (jarak, jalur) yang belum dihasilkan
+    candidates = []
+    seen = {tuple(first_path)}
+
+    while k is None or len(shortest_paths) < k:
+        last_path = shortest_paths[-1]
+        root_cost = 0
+        for i in range(len(last_path) - 1):
+            spur_node = last_path[i]
+            root_path = last_path[:i + 1]
+
+            # Sembunyikan edge berikutnya dari semua jalur yang sudah ditemukan dengan root yang sama,
+            # dan node-node di root (kecuali spur_node) supaya jalur tidak membentuk loop
+            masked_edges = {(path[i], path[i + 1]) for path in shortest_paths if path[:i + 1] == root_path}
+            masked_graph = MaskedGraph(graph, root_path[:-1], masked_edges)
+
+            spur_path = _shortest_path(masked_graph, spur_node, end_node, queue)
+            if spur_path is not None:
+                total_path = root_path[:-1] + spur_path
+                if tuple(total_path) not in seen:
+                    seen.add(tuple(total_path))
+                    heapq.heappush(candidates, (root_cost + _path_cost(graph, spur_path), total_path))
+
+            root_cost += graph[spur_node][last_path[i + 1]]
+
+        if not candidates:
+            return
+        cost, path = heapq.heappop(candidates)
+        shortest_paths.append(path)
+        yield cost, ' -> '.join(path)
@@ -0,0 +1,98 @@
+import numpy as np
+
+from edge_sort import pack_edges, radix_argsort
+
+def graph_edges(graph):
+    """
+    Mengambil (jumlah_node, sources, targets, weights) dari PrimGraph (adj list dua arah) atau MyGraph (list [u, v, w]).
+    Pada PrimGraph setiap sisi tersimpan dua kali, jadi hanya arah u < v yang diambil.
+    """
+    if hasattr(graph, 'adj'):
+        sources = []
+        targets = []
+        weights = []
+        for u, neighbors in enumerate(graph.adj):
+            for v, w in neighbors:
+                if u < v:
+                    sources.append(u)
+                    targets.append(v)
+                    weights.append(w)
+        return graph.V, np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64), np.array(weights)
+    return (graph.V, *pack_edges(graph.graph))
+
+def boruvka_arrays(num_nodes, sources, targets, weights):
+    """
+    Algoritma Borůvka yang setiap ronde-nya dikerjakan dengan operasi array NumPy:
+        1. untuk setiap komponen, cari sisi keluar termurah dengan np.minimum.at (di kedua arah sisi)
+        2. semua sisi termurah itu masuk MST, lalu komponen yang terhubung digabung dengan pointer jumping
+        3. kontraksi: label komponen dipadatkan menjadi 0..k-1 dan sisi yang kedua ujungnya sudah satu komponen dibuang
+    Jumlah komponen paling sedikit berkurang setengah setiap ronde, jadi hanya ada O(log V) ronde.
+    Mengembalikan array indeks (ke array input) dari sisi-sisi MST. Jika graf tidak terhubung, hasilnya minimum spanning forest.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+
+    # Peringkat unik setiap sisi berdasarkan bobot (seri dipecah dengan indeks sisi), supaya pilihan sisi termurah
+    # konsisten di semua komponen dan tidak pernah membentuk siklus ketika ada bobot yang sama
+    by_weight = radix_argsort(weights)
+    edge_rank = np.empty(len(by_weight), dtype=np.int64)
+    edge_rank[by_weight] = np.arange(len(by_weight))
+
+    # comp[node] = label komponen node saat ini, u/v = label komponen ujung-ujung sisi yang masih hidup
+    comp = np.arange(num_nodes)
+    num_components = num_nodes
+    alive = sources != targets
+    u, v, edge_rank = sources[alive], targets[alive], edge_rank[alive]
+
+    chosen = []
+    while len(u):
+        # Langkah 1: sisi termurah per komponen, dengan melihat setiap sisi dari kedua ujungnya.
+        # np.minimum.at tidak perlu mengurutkan sisi per komponen terlebih dahulu (berbeda dengan minimum.reduceat)
+        best = np.full(num_components, len(by_weight), dtype=np.int64)
+        np.minimum.at(best, u, edge_rank)
+        np.minimum.at(best, v, edge_rank)
+        owners = np.flatnonzero(best < len(by_weight))
+        cheapest = by_weight[best[owners]]
+
+        # Satu sisi bisa dipilih oleh kedua komponen ujungnya, cukup dicatat sekali
+        chosen.append(np.unique(cheapest))
+
+        # Langkah 2: setiap komponen menunjuk ke komponen di seberang sisi termurahnya
+        source_comp = comp[sources[cheapest]]
+        target_comp = comp[targets[cheapest]]
+        parent = np.arange(num_components)
+        parent[owners] = np.where(source_comp == owners, target_comp, source_comp)
+
+        # Satu-satunya siklus yang mungkin adalah dua komponen yang saling menunjuk; yang labelnya lebih kecil jadi root
+        labels = np.arange(num_components)
+        mutual = (parent[parent] == labels) & (labels < parent)
+        parent[mutual] = labels[mutual]
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+        # Langkah 3: kontraksi komponen (root diberi label baru 0..k-1 berurutan) dan buang sisi internal
+        is_root = parent == labels
+        new_label = (np.cumsum(is_root) - 1)[parent]
+        num_components = int(is_root.sum())
+        comp = new_label[comp]
+        u, v = new_label[u], new_label[v]
+        alive = u != v
+        u, v, edge_rank = u[alive], v[alive], edge_rank[alive]
+
+    if not chosen:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(chosen)
+
+def boruvka_mst(graph):
+    """
+    MST dari PrimGraph atau MyGraph dengan algoritma Borůvka.
+    Mengembalikan (mst, total_cost) dengan mst berupa list tuple (u, v, weight).
+    """
+    num_nodes, sources, targets, weights = graph_edges(graph)
+    picked = boruvka_arrays(num_nodes, sources, targets, weights)
+    mst = list(zip(sources[picked].tolist(), targets[picked].tolist(), weights[picked].tolist()))
+    total_cost = sum(w for _, _, w in mst)
+    return mst, total_cost
@@ -0,0 +1,74 @@
+from array import array
+
+class DisjointSet:
+    """
+    Struktur data disjoint-set (union-find) untuk node 0..n-1, disimpan di dua array('i') datar.
+    find memakai path halving secara iteratif (tidak ada rekursi, jadi aman untuk rantai yang sangat panjang)
+    dan union menggabungkan set yang lebih kecil ke set yang lebih besar (union by size).
+    """
+
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        # Jumlah set (komponen) yang masih terpisah
+        self.count = n
+
+    def __len__(self):
+        return len(self.parent)
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            # Path halving: setiap node yang dilewati langsung menunjuk ke kakeknya
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """
+        Menggabungkan set yang berisi x dan y. Mengembalikan False jika keduanya sudah satu set.
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def union_many(self, sources, targets):
+        """
+        Melakukan union untuk setiap pasangan (sources[i], targets[i]) secara berurutan dan mengembalikan
+        list indeks i dari pasangan yang benar-benar menggabungkan dua set (untuk Kruskal: edge yang masuk MST).
+        find dan union ditulis langsung di dalam loop supaya tidak ada overhead pemanggilan method per edge.
+        Berhenti lebih awal begitu semua node sudah menjadi satu set, karena pasangan sisanya pasti ditolak.
+        """
+        parent = self.parent
+        size = self.size
+        accepted = []
+        count = self.count
+        for i, (x, y) in enumerate(zip(sources, targets)):
+            if count <= 1:
+                break
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            count -= 1
+            accepted.append(i)
+        self.count = count
+        return accepted
@@ -0,0 +1,341 @@
+class LinkCutTree:
+    """
+    Link-cut tree (Sleator-Tarjan) untuk hutan berakar dengan nilai di setiap node.
+    Setiap path preferensi disimpan sebagai splay tree; semua operasi berjalan dalam O(log n) amortized.
+    Struktur disimpan di list datar yang diindeks dengan id node (-1 berarti tidak ada), dan semuanya iteratif.
+    path_max(x, y) mengembalikan id node dengan nilai terbesar pada path x..y.
+    """
+
+    def __init__(self):
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.flip = []
+        self.value = []
+        # best[x] = id node dengan nilai terbesar di subtree splay x
+        self.best = []
+
+    def add_node(self, value):
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.value.append(value)
+        self.best.append(len(self.value) - 1)
+        return len(self.value) - 1
+
+    def reset_node(self, x, value):
+        # Dipakai ulang untuk node yang sudah terputus dari semua node lain
+        self.left[x] = self.right[x] = self.parent[x] = -1
+        self.flip[x] = False
+        self.value[x] = value
+        self.best[x] = x
+
+    def _is_splay_root(self, x):
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x):
+        if self.flip[x]:
+            self.flip[x] = False
+            self.left[x], self.right[x] = self.right[x], self.left[x]
+            for child in (self.left[x], self.right[x]):
+                if child != -1:
+                    self.flip[child] = not self.flip[child]
+
+    def _update(self, x):
+        value, best = self.value, self.best
+        result = x
+        left, right = self.left[x], self.right[x]
+        if left != -1 and value[best[left]] > value[result]:
+            result = best[left]
+        if right != -1 and value[best[right]] > value[result]:
+            result = best[right]
+        best[x] = result
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if g != -1:
+            if left[g] == p:
+                left[g] = x
+            elif right[g] == p:
+                right[g] = x
+        parent[x] = g
+
+        if left[p] == x:
+            child = right[x]
+            left[p] = child
+            right[x] = p
+        else:
+            child = left[x]
+            right[p] = child
+            left[x] = p
+        if child != -1:
+            parent[child] = p
+        parent[p] = x
+        self._update(p)
+        self._update(x)
+
+    def _splay(self, x):
+        is_splay_root = self._is_splay_root
+        # Flag flip harus diturunkan dulu dari root splay sampai ke x
+        path = [x]
+        while not is_splay_root(path[-1]):
+            path.append(self.parent[path[-1]])
+        for node in reversed(path):
+            if self.flip[node]:
+                self._push(node)
+
+        while not is_splay_root(x):
+            p = self.parent[x]
+            if not is_splay_root(p):
+                g = self.parent[p]
+                # zig-zig memutar parent dulu, zig-zag memutar x dua kali
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    def _access(self, x):
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._update(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def _make_root(self, x):
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+
+    def find_root(self, x):
+        self._access(x)
+        self._push(x)
+        while self.left[x] != -1:
+            x = self.left[x]
+            self._push(x)
+        self._splay(x)
+        return x
+
+    def connected(self, x, y):
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def link(self, x, y):
+        """
+        Menghubungkan x dan y dengan edge. x dan y harus berada di tree yang berbeda.
+        """
+        self._make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x, y):
+        """
+        Memutus edge x - y. x dan y harus bertetangga langsung.
+        """
+        self._make_root(x)
+        self._access(y)
+        # Sekarang y adalah root splay dan x satu-satunya node di kiri y
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._update(y)
+
+    def path_max(self, x, y):
+        """
+        Id node dengan nilai terbesar pada path x..y, atau -1 jika x dan y tidak terhubung.
+        """
+        self._make_root(x)
+        if self.find_root(y) != x:
+            return -1
+        self._access(y)
+        return self.best[y]
+
+    def set_value(self, x, value):
+        self._access(x)
+        self.value[x] = value
+        self._update(x)
+
+class DynamicMST:
+    """
+    Minimum spanning forest dari graf undirected yang terus diperbarui ketika edge ditambah, diubah bobotnya, atau dihapus,
+    tanpa menjalankan ulang Kruskal/Prim dari awal.
+    Setiap edge MST disimpan sebagai node tersendiri di LinkCutTree dengan nilai = bobotnya (node graf bernilai -inf),
+    sehingga edge terberat pada path u..v di MST bisa dicari dalam O(log V):
+        - edge baru u - v: jika u dan v belum terhubung, edge langsung masuk MST; jika sudah, edge terberat di path u..v
+          diganti dengan edge baru kalau edge baru lebih murah
+        - bobot edge MST turun / bobot edge non-MST naik: MST tidak berubah
+        - bobot edge non-MST turun: sama seperti menambah edge baru
+        - bobot edge MST naik atau edge MST dihapus: edge diputus, lalu dicari edge non-MST termurah yang menghubungkan
+          lagi kedua bagiannya. Ini BUKAN perbaikan lokal: _reconnect menelusuri satu bagian tree dan memindai semua
+          edge non-MST, jadi operasi ini O(V + E), setara dengan menghitung ulang MST tanpa sorting
+    total_weight dan mst_edges (dict {frozenset({u, v}): bobot}) selalu berisi MST saat ini, jadi bisa dibaca dalam O(1).
+    """
+
+    def __init__(self):
+        self.tree = LinkCutTree()
+        self.node_ids = {}
+        self.endpoints = {}
+        self.weights = {}
+        # key edge MST -> id node edge di LinkCutTree, dan sebaliknya
+        self.tree_edge_ids = {}
+        self.edge_keys = {}
+        self.non_tree_edges = set()
+        # Tetangga setiap node di MST, dipakai untuk mencari isi satu bagian tree setelah sebuah edge diputus
+        self.tree_neighbors = {}
+        self.mst_edges = {}
+        self.total_weight = 0
+        self._free_ids = []
+
+    @classmethod
+    def from_adjacency_list(cls, adjacency_list):
+        """
+        Membuat DynamicMST dari adjacency list {node: [(tetangga, bobot), ...]} seperti Graph.adjacency_list.
+        Jika ada beberapa edge paralel di antara pasangan node yang sama, hanya bobot terkecilnya yang dipakai.
+        """
+        dynamic_mst = cls()
+        for node in adjacency_list:
+            dynamic_mst.add_node(node)
+        lightest = {}
+        for u, neighbors in adjacency_list.items():
+            for v, weight in neighbors:
+                key = frozenset((u, v))
+                if key not in lightest or weight < lightest[key][2]:
+                    lightest[key] = (u, v, weight)
+        for u, v, weight in lightest.values():
+            dynamic_mst.insert_edge(u, v, weight)
+        return dynamic_mst
+
+    def add_node(self, node):
+        if node not in self.node_ids:
+            self.node_ids[node] = self.tree.add_node(float('-inf'))
+            self.tree_neighbors[node] = set()
+
+    def edges(self):
+        """
+        List edge MST saat ini sebagai tuple (u, v, bobot).
+        """
+        return [(*self.endpoints[key], weight) for key, weight in self.mst_edges.items()]
+
+    def component(self, node):
+        """
+        Himpunan node yang berada di tree MST yang sama dengan node (DFS di tree_neighbors).
+        """
+        side = {node}
+        stack = [node]
+        while stack:
+            for neighbor in self.tree_neighbors[stack.pop()]:
+                if neighbor not in side:
+                    side.add(neighbor)
+                    stack.append(neighbor)
+        return side
+
+    def insert_edge(self, u, v, weight):
+        """
+        Menambahkan edge u - v. Jika edge sudah ada, sama dengan update_edge.
+        """
+        key = frozenset((u, v))
+        if key in self.weights:
+            self.update_edge(u, v, weight)
+            return
+        self.add_node(u)
+        self.add_node(v)
+        self.endpoints[key] = (u, v)
+        self.weights[key] = weight
+        self._insert(key)
+
+    def update_edge(self, u, v, weight):
+        key = frozenset((u, v))
+        if key not in self.weights:
+            self.insert_edge(u, v, weight)
+            return
+        old_weight = self.weights[key]
+        self.weights[key] = weight
+
+        if key in self.tree_edge_ids:
+            if weight <= old_weight:
+                self.tree.set_value(self.tree_edge_ids[key], weight)
+                self.mst_edges[key] = weight
+                self.total_weight += weight - old_weight
+            else:
+                # Edge yang lebih mahal mungkin bukan lagi yang termurah untuk menghubungkan kedua bagian
+                self._cut(key)
+                self.non_tree_edges.add(key)
+                self._reconnect(u)
+        elif weight < old_weight:
+            self.non_tree_edges.discard(key)
+            self._insert(key)
+
+    def delete_edge(self, u, v):
+        key = frozenset((u, v))
+        if key not in self.weights:
+            return
+        if key in self.tree_edge_ids:
+            self._cut(key)
+            self._forget(key)
+            self._reconnect(u)
+        else:
+            self.non_tree_edges.discard(key)
+            self._forget(key)
+
+    def _forget(self, key):
+        del self.weights[key]
+        del self.endpoints[key]
+
+    def _insert(self, key):
+        u, v = self.endpoints[key]
+        if u == v:
+            self.non_tree_edges.add(key)
+            return
+        heaviest = self.tree.path_max(self.node_ids[u], self.node_ids[v])
+        if heaviest == -1:
+            self._link(key)
+        elif self.tree.value[heaviest] > self.weights[key]:
+            heaviest_key = self.edge_keys[heaviest]
+            self._cut(heaviest_key)
+            self.non_tree_edges.add(heaviest_key)
+            self._link(key)
+        else:
+            self.non_tree_edges.add(key)
+
+    def _link(self, key):
+        u, v = self.endpoints[key]
+        weight = self.weights[key]
+        if self._free_ids:
+            edge_id = self._free_ids.pop()
+            self.tree.reset_node(edge_id, weight)
+        else:
+            edge_id = self.tree.add_node(weight)
+        self.tree.link(self.node_ids[u], edge_id)
+        self.tree.link(edge_id, self.node_ids[v])
+        self.tree_edge_ids[key] = edge_id
+        self.edge_keys[edge_id] = key
+        self.tree_neighbors[u].add(v)
+        self.tree_neighbors[v].add(u)
+        self.mst_edges[key] = weight
+        self.total_weight += weight
+
+    def _cut(self, key):
+        u, v = self.endpoints[key]
+        edge_id = self.tree_edge_ids.pop(key)
+        del self.edge_keys[edge_id]
+        self.tree.cut(self.node_ids[u], edge_id)
+        self.tree.cut(edge_id, self.node_ids[v])
+        self.tree_neighbors[u].discard(v)
+        self.tree_neighbors[v].discard(u)
+        self._free_ids.append(edge_id)
+        self.total_weight -= self.mst_edges.pop(key)
+
+    def _reconnect(self, node):
+        # Setelah satu edge MST diputus, edge non-MST termurah yang menyeberang dari bagian tree yang berisi node
+        # ke bagian lainnya masuk ke MST. Isi bagian itu dicari dengan component(), jadi cek tiap edge cukup O(1)
+        side = self.component(node)
+
+        crossing = [key for key in self.non_tree_edges if (self.endpoints[key][0] in side) != (self.endpoints[key][1] in side)]
+        if crossing:
+            best_key = min(crossing, key=self.weights.__getitem__)
+            self.non_tree_edges.discard(best_key)
+            self._link(best_key)
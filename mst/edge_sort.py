@@ -0,0 +1,58 @@
+import numpy as np
+
+from disjoint_set import DisjointSet
+
+# Lebar satu digit pada LSD radix sort. argsort(kind='stable') NumPy memakai radix sort untuk tipe 16 bit,
+# jadi setiap pass berjalan O(E) tanpa perbandingan
+RADIX_BITS = 16
+
+def pack_edges(edges):
+    """
+    Mengubah list sisi [u, v, w] (seperti MyGraph.graph) menjadi tiga array NumPy datar: sources, targets, weights.
+    """
+    if not edges:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    packed = np.array(edges)
+    return packed[:, 0].astype(np.int64), packed[:, 1].astype(np.int64), packed[:, 2]
+
+def radix_argsort(weights):
+    """
+    Mengembalikan urutan indeks yang mengurutkan weights secara menaik dan stabil.
+    Bobot integer (termasuk float yang semuanya bernilai bulat) diurutkan dengan LSD radix sort per digit
+    RADIX_BITS bit; jumlah pass hanya sebanyak digit yang dibutuhkan oleh rentang bobot (1 pass jika rentangnya < 65536).
+    Bobot pecahan memakai argsort stabil biasa.
+    """
+    weights = np.asarray(weights)
+    if len(weights) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if weights.dtype.kind == 'f':
+        if not np.all(np.mod(weights, 1) == 0):
+            return np.argsort(weights, kind='stable')
+        weights = weights.astype(np.int64)
+
+    # Geser supaya bobot terkecil menjadi 0, lalu urutkan digit demi digit mulai dari yang paling rendah
+    keys = (weights.astype(np.int64) - weights.min()).astype(np.uint64)
+    mask = np.uint64((1 << RADIX_BITS) - 1)
+    order = np.arange(len(keys))
+    shift = 0
+    max_key = int(keys.max())
+    while True:
+        digits = ((keys[order] >> np.uint64(shift)) & mask).astype(np.uint16)
+        order = order[np.argsort(digits, kind='stable')]
+        shift += RADIX_BITS
+        if max_key >> shift == 0:
+            return order
+
+def kruskal_arrays(num_nodes, sources, targets, weights):
+    """
+    Kruskal langsung di atas array sisi: urutkan dengan radix_argsort, lalu jalankan union_many pada array
+    yang sudah diurutkan tanpa membuat list/tuple per sisi.
+    Mengembalikan array indeks (ke array input) dari sisi-sisi yang masuk MST, urut dari bobot terkecil.
+    Jika graf tidak terhubung, hasilnya minimum spanning forest.
+    """
+    order = radix_argsort(weights)
+    sorted_sources = np.ascontiguousarray(np.asarray(sources, dtype=np.int64)[order])
+    sorted_targets = np.ascontiguousarray(np.asarray(targets, dtype=np.int64)[order])
+    # Iterasi memoryview langsung menghasilkan int Python, lebih cepat daripada skalar NumPy
+    accepted = DisjointSet(num_nodes).union_many(memoryview(sorted_sources), memoryview(sorted_targets))
+    return order[np.array(accepted, dtype=np.int64)]
@@ -1,5 +1,13 @@
+import heapq
+import random
+
 from graphviz import Graph
 
+from disjoint_set import DisjointSet
+
+# Kelompok sisi yang lebih kecil dari ini langsung diurutkan, tidak dipartisi lagi (dipakai oleh FilterKruskal)
+FILTER_KRUSKAL_THRESHOLD = 1024
+
 class MyGraph: 
 
     def __init__(self, vertices): 
@@ -10,30 +18,14 @@ class MyGraph:
     def addEdge(self, u, v, w): 
         self.graph.append([u, v, w]) 
 
-    # Method untuk mencari root dari i dan update parent dari setiap node yang ditrace ke final parent (path compression)
-    def find(self, parent, i): 
-        if parent[i] != i: 
-
-            # Reassign current parent ke final parent supaya proses mencari parent dari node lebih cepat
-            parent[i] = self.find(parent, parent[i]) 
-        return parent[i] 
-
-    # Method untuk merge dua set
-    def union(self, parent, rank, x, y): 
-
-        # Merge set yang rank nya lebih kecil ke set yang lebih besar
-        if rank[x] < rank[y]: 
-            parent[x] = y 
-        elif rank[x] > rank[y]: 
-            parent[y] = x 
-
-        # Jika rank dua set sama, buat yang satunya root dari yang lain dan increment rank dengan 1
-        else: 
-            parent[y] = x 
-            rank[x] += 1
-
     # Fungsi mencari MST dengan algoritma kruskal
-    def KruskalMST(self): 
+    # mode='sort' mengurutkan semua sisi dulu, mode='heap' memakai KruskalHeap (sisi diambil dari heap seperlunya),
+    # mode='radix' memakai KruskalRadix (radix sort NumPy untuk bobot integer), mode='filter' memakai FilterKruskal
+    def KruskalMST(self, mode='sort'): 
+        if mode in ('heap', 'radix', 'filter'):
+            result = {'heap': self.KruskalHeap, 'radix': self.KruskalRadix, 'filter': self.FilterKruskal}[mode]()
+            self.printMST(result)
+            return result
 
         # Array untuk hasil MST
         result = [] 
@@ -47,37 +39,107 @@ class MyGraph:
         # Urutkan sisi sesuai weight dari yang paling kecil
         self.graph = sorted(self.graph, key=lambda item: item[2]) 
 
-        parent = [] 
-        rank = [] 
+        # Disjoint-set berbasis array untuk semua node (lihat disjoint_set.py)
+        sets = DisjointSet(self.V) 
 
-        # Buat node sesuai dengan jumlah node dan rank awal (0) 
-        for node in range(self.V): 
-            parent.append(node) 
-            rank.append(0) 
+        # Jumlah node MST pasti berjumlah v - 1 (v = jumlah node), kecuali graf tidak terhubung dan sisinya habis
+        while e < self.V - 1 and i < len(self.graph): 
 
-        # Jumlah node MST pasti berjumlah v - 1 (v = jumlah node)
-        while e < self.V - 1: 
-
-            # Iterasi dari weight yang paling kecil, set x untuk mencari parent dari u begitu pula dengan y dan v
+            # Iterasi dari weight yang paling kecil
             u, v, w = self.graph[i] 
             i = i + 1
-            x = self.find(parent, u) 
-            y = self.find(parent, v) 
 
-            # Jika parent dari kedua set itu tak sama maka append ke result dan lakukan union untuk update parent dan rank agar iterasi selanjutnya bisa optimal
-            if x != y: 
+            # Jika u dan v belum satu set maka union berhasil, append ke result
+            if sets.union(u, v): 
                 e = e + 1
                 result.append([u, v, w]) 
-                self.union(parent, rank, x, y) 
             # Jika sama jangan lakukan apapun karena jika dilakukan akan membuat cycle
 
+        self.printMST(result)
+        return result
+
+    # Kruskal dengan heap: sisi di-heapify (O(E), tanpa sort penuh) lalu yang termurah diambil satu per satu
+    # hanya sampai semua node terhubung. Jika graf tidak terhubung, hasilnya minimum spanning forest
+    def KruskalHeap(self): 
+
+        # Tuple (weight, u, v) supaya heap diurutkan berdasarkan weight, self.graph sendiri tidak diubah
+        heap = [(w, u, v) for u, v, w in self.graph] 
+        heapq.heapify(heap) 
+
+        sets = DisjointSet(self.V) 
+        result = [] 
+
+        # Berhenti begitu tinggal satu komponen, sisa sisi di heap tidak perlu diurutkan sama sekali
+        while heap and sets.count > 1: 
+            w, u, v = heapq.heappop(heap) 
+            if sets.union(u, v): 
+                result.append([u, v, w]) 
+        return result
+
+    # Kruskal dengan radix sort: sisi dikemas ke array NumPy, diurutkan per digit bobot, lalu union-find berjalan
+    # langsung di atas array tersebut (lihat edge_sort.py). Hanya sisi yang masuk MST yang dibuat lagi sebagai list.
+    # edge_sort (dan NumPy) baru di-import di sini, jadi mode lain tetap bisa dipakai tanpa NumPy
+    def KruskalRadix(self): 
+        from edge_sort import kruskal_arrays, pack_edges
+
+        sources, targets, weights = pack_edges(self.graph) 
+        return [self.graph[i] for i in kruskal_arrays(self.V, sources, targets, weights).tolist()]
+
+    # Filter-Kruskal: sisi dipartisi di sekitar pivot bobot menjadi kelompok ringan dan berat. Kelompok ringan diproses dulu,
+    # lalu sisi berat yang kedua ujungnya sudah terhubung dibuang (filter) sebelum sempat diurutkan.
+    # Memakai stack, bukan rekursi, supaya tidak kena batas rekursi. Hasilnya minimum spanning forest jika graf tidak terhubung
+    def FilterKruskal(self): 
+        sets = DisjointSet(self.V) 
+        result = [] 
+
+        # Isi stack: (list sisi, perlu difilter atau tidak). Kelompok ringan ada di atas supaya diproses lebih dulu
+        stack = [(self.graph, False)] 
+        while stack and sets.count > 1: 
+            edges, needs_filter = stack.pop() 
+
+            # Buang sisi yang kedua ujungnya sudah satu set karena pasti membentuk cycle.
+            # Jika sisinya banyak, root semua node dihitung sekali dulu supaya filter cukup membaca list
+            if needs_filter: 
+                if 2 * len(edges) > self.V: 
+                    roots = [sets.find(node) for node in range(self.V)] 
+                    edges = [edge for edge in edges if roots[edge[0]] != roots[edge[1]]] 
+                else: 
+                    edges = [edge for edge in edges if sets.find(edge[0]) != sets.find(edge[1])] 
+
+            # Kelompok yang ukurannya sebanding dengan jumlah komponen tersisa langsung diurutkan
+            if len(edges) > max(FILTER_KRUSKAL_THRESHOLD, 2 * sets.count): 
+                # Pivot diambil dari sampel bobot acak, di kuantil yang membuat kelompok ringan berisi sekitar
+                # 2x jumlah komponen yang tersisa (maksimal setengah), karena paling banyak hanya (jumlah komponen - 1) sisi lagi yang bisa masuk MST.
+                # Dengan begitu jumlah partisi (dan pass di Python) tetap sedikit
+                sample = sorted(edge[2] for edge in random.sample(edges, min(len(edges), 1000))) 
+                fraction = min(0.5, 2 * sets.count / len(edges)) 
+                pivot = sample[int(fraction * (len(sample) - 1))] 
+                light = [edge for edge in edges if edge[2] <= pivot] 
+                heavy = [edge for edge in edges if edge[2] > pivot] 
+
+                # Jika semua sisi bobotnya <= pivot, partisi tidak bisa mengecilkan kelompok, jadi langsung diurutkan
+                if heavy: 
+                    stack.append((heavy, True)) 
+                    stack.append((light, False)) 
+                    continue 
+
+            # Kelompok kecil: Kruskal biasa (urutkan lalu union)
+            edges = sorted(edges, key=lambda item: item[2]) 
+            accepted = sets.union_many([edge[0] for edge in edges], [edge[1] for edge in edges]) 
+            result.extend(edges[i] for i in accepted) 
+        return result
+
+    # Cetak sisi-sisi hasil MST beserta total weight-nya
+    def printMST(self, result): 
         minimumCost = 0
         print("\nSisi pada MST") 
         for u, v, weight in result: 
             minimumCost += weight 
             print("%d -- %d == %d" % (u, v, weight)) 
-        print("Minimum Spanning Tree:", minimumCost) 
-        return result
+        if len(result) < self.V - 1: 
+            print("Graf tidak terhubung, hasilnya Minimum Spanning Forest:", minimumCost) 
+        else: 
+            print("Minimum Spanning Tree:", minimumCost) 
 
 def draw_graph_with_mst(all_edges, mst_edges, filename='graph_with_mst'):
     dot = Graph(comment='Graph with MST')
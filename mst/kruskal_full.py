@@ -1,6 +1,18 @@
-import re, graphviz, tkinter
+import re, graphviz, tkinter, os, sys
+from importlib.util import find_spec
 from tkinter import filedialog
 
+# Format file graf biner (.grf) didefinisikan di modul djikstra
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'djikstra'))
+from csr_graph import CSRGraph
+from graph_file import read_graph_file, write_graph_file
+
+from disjoint_set import DisjointSet
+from dynamic_mst import DynamicMST
+
+# Radix sort di edge_sort.py butuh NumPy; jika tidak terinstall, sisi diurutkan dengan sorted() biasa
+HAS_NUMPY = find_spec('numpy') is not None
+
 class Graph:
     def __init__(self):
         """
@@ -9,6 +21,8 @@ class Graph:
         Setiap key pada dictionary ini adalah nama atau identifier dari node, dan value-nya adalah list dari tuple yang berisi node tetangga beserta bobot (weight) dari edge yang menghubungkan kedua node tersebut.
         """
         self.adjacency_list = {}
+        # MST dari graf saat ini yang diperbarui setiap kali node/edge berubah (lihat dynamic_mst.py)
+        self.dynamic_mst = DynamicMST()
         
     def add_node(self, node_name):
         """
@@ -22,6 +36,7 @@ class Graph:
         """
         if node_name not in self.adjacency_list:
             self.adjacency_list[node_name] = []
+            self.dynamic_mst.add_node(node_name)
             print(f"Node '{node_name}' berhasil ditambahkan ke dalam konfigurasi data graf yang termuat saat ini.")
             return True
         else:
@@ -63,12 +78,16 @@ class Graph:
                     self.adjacency_list[v].remove((u, existing_weight))
                     self.adjacency_list[u].append((v, weight))
                     self.adjacency_list[v].append((u, weight))
+                    self.dynamic_mst.update_edge(u, v, weight)
                     print(f"Bobot edge dari '{u}' ke '{v}' dan dari '{v}' ke '{u}' telah berhasil diperbarui menjadi sebesar {weight}.")
+                    print(f"Total bobot MST saat ini: {self.dynamic_mst.total_weight}")
                     return True
         
         self.adjacency_list[u].append((v, weight))
         self.adjacency_list[v].append((u, weight))
+        self.dynamic_mst.insert_edge(u, v, weight)
         print(f"Edge dari '{u}' ke '{v}' dan dari '{v}' ke '{u}' dengan bobot yang sebesar {weight} telah berhasil ditambahkan ke dalam konfigurasi data graf yang termuat saat ini.")
+        print(f"Total bobot MST saat ini: {self.dynamic_mst.total_weight}")
         return True
         
     def display_graph(self, save_to_file=False):
@@ -122,8 +141,10 @@ class Graph:
         try:
             root = tkinter.Tk()
             root.withdraw()
-            file_path = filedialog.asksaveasfilename(defaultextension=".dot", filetypes=[("DOT files", "*.dot")])
-            if file_path:
+            file_path = filedialog.asksaveasfilename(defaultextension=".dot", filetypes=[("DOT files", "*.dot"), ("Binary graph files", "*.grf")])
+            if file_path and file_path.lower().endswith('.grf'):
+                self.save_graph_to_binary_file(file_path)
+            elif file_path:
                 with open(file_path, 'w') as file:
                     file.write("graph G {\n")
                     file.write("  rankdir=LR;\n")
@@ -150,9 +171,11 @@ class Graph:
         try:
             root = tkinter.Tk()
             root.withdraw()
-            file_path = filedialog.askopenfilename(filetypes=[("DOT files", "*.dot")])
+            file_path = filedialog.askopenfilename(filetypes=[("DOT files", "*.dot"), ("Binary graph files", "*.grf")])
 
-            if file_path:
+            if file_path and file_path.lower().endswith('.grf'):
+                self.load_graph_from_binary_file(file_path)
+            elif file_path:
                 with open(file_path, 'r') as file:
                     lines = file.readlines()
 
@@ -173,12 +196,32 @@ class Graph:
                         if (u, weight) not in self.adjacency_list[v]:
                             self.adjacency_list[v].append((u, weight))
 
+                self.dynamic_mst = DynamicMST.from_adjacency_list(self.adjacency_list)
                 print(f"Graf berhasil dimuat dari file '{file_path}'.")
             else:
                 print("Operasi pemuatan graf dibatalkan.")
         except Exception as e:
             print(f"Terjadi kesalahan saat memuat graf dari file: {e}")
         
+    def save_graph_to_binary_file(self, file_path):
+        """
+        Saves the currently-loaded graph data configuration into a memory-mappable binary .grf file (see djikstra/graph_file.py).
+        """
+        graph = {node: dict(neighbors) for node, neighbors in self.adjacency_list.items()}
+        write_graph_file(file_path, CSRGraph.from_dict(graph))
+        print(f"Graf berhasil disimpan ke dalam file graf biner '{file_path}'.")
+
+    def load_graph_from_binary_file(self, file_path):
+        """
+        Loads a graph configuration from a binary .grf file without reparsing any text.
+        """
+        graph = read_graph_file(file_path).to_dict()
+        self.adjacency_list.clear()
+        for node, neighbors in graph.items():
+            self.adjacency_list[node] = list(neighbors.items())
+        self.dynamic_mst = DynamicMST.from_adjacency_list(self.adjacency_list)
+        print(f"Graf berhasil dimuat dari file graf biner '{file_path}'.")
+
     def print_adjacency_list(self):
         """
         Menampilkan adjacency list dari konfigurasi data graf yang termuat saat ini.
@@ -207,6 +250,7 @@ class Graph:
             print("Graf saat ini sudah kosong. Tidak ada data yang perlu dihapus.")
         else:
             self.adjacency_list.clear()
+            self.dynamic_mst = DynamicMST()
             print("Semua konfigurasi data graf yang sedang termuat saat ini sudah berhasil dihapus dari program ini. Graf telah diatur ulang dari awal.")
             
     def kruskals_algorithm_mst(self):
@@ -218,57 +262,37 @@ class Graph:
             print("Konfigurasi data graf saat ini isinya masih kosong atau masih terlalu sedikit node untuk membentuk sebuah MST.")
             return
 
+        # nama node dipetakan ke indeks 0..V-1 supaya sisi-sisinya bisa disimpan di array integer
+        nodes = list(self.adjacency_list)
+        node_index = {node: i for i, node in enumerate(nodes)}
+
         # collect semua sisi-sisi yang "unik" (karena graf ini undirected dan kita menggunakan adjacency list di atas)
-        edges = []
-        seen = set()
+        # langsung ke tiga list datar sources, targets, weights
+        sources = []
+        targets = []
+        weights = []
         for u in self.adjacency_list:
             for v, w in self.adjacency_list[u]:
-                if (v, u) not in seen:
-                    edges.append((w, u, v))
-                    seen.add((u, v))
-
-        # urutkan sisi-sisi (edges) berdasarkan besar bobotnya. Fungsi sort di sini sudah mengsort list edges di atas ke dalam urutab menaik (ascending)
-        edges.sort()
-
-        # inisialisasi struktur data disjoint-set (union-find)
-        parent = {}
-        rank = {}
+                if node_index[u] < node_index[v]:
+                    sources.append(node_index[u])
+                    targets.append(node_index[v])
+                    weights.append(w)
 
-        # definisi fungsi find(node)
-        def find(node):
-            while parent[node] != node:
-                parent[node] = parent[parent[node]]
-                node = parent[node]
-            return node
-
-        # definisi fungsi union(u, v)
-        def union(u, v):
-            root_u = find(u)
-            root_v = find(v)
-            if root_u == root_v:
-                return False
-            if rank[root_u] < rank[root_v]:
-                parent[root_u] = root_v
-            else:
-                parent[root_v] = root_u
-                if rank[root_u] == rank[root_v]:
-                    rank[root_u] += 1
-            return True
-
-        # Pertama-tama, setiap node akan menjadi parent dirinya sendiri
-        for node in self.adjacency_list:
-            parent[node] = node
-            rank[node] = 0
+        # urutkan sisi-sisi berdasarkan bobot dengan radix sort, lalu jalankan union-find di atas array yang sudah terurut
+        # (lihat edge_sort.py). Sisi yang berhasil di-union masuk ke MST karena tidak membentuk siklus
+        if HAS_NUMPY:
+            from edge_sort import kruskal_arrays
+            picked = kruskal_arrays(len(nodes), sources, targets, weights).tolist()
+        else:
+            order = sorted(range(len(weights)), key=weights.__getitem__)
+            accepted = DisjointSet(len(nodes)).union_many([sources[i] for i in order], [targets[i] for i in order])
+            picked = [order[i] for i in accepted]
 
-        # Step 5: Proses edge satu per satu, tambahkan ke MST jika tidak membentuk siklus
         mst_edges = []
         total_weight = 0
-        for w, u, v in edges:
-            if union(u, v):
-                mst_edges.append((u, v, w))
-                total_weight += w
-            if len(mst_edges) == len(self.adjacency_list) - 1:
-                break
+        for i in picked:
+            mst_edges.append((nodes[sources[i]], nodes[targets[i]], weights[i]))
+            total_weight += weights[i]
 
         if len(mst_edges) != len(self.adjacency_list) - 1:
             print("Graf tidak terhubung, MST tidak dapat dibentuk dari semua node.")
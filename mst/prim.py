@@ -1,6 +1,19 @@
 import heapq
+import os
+import sys
+from importlib.util import find_spec
 from graphviz import Graph
 
+# IndexedHeap dipakai bersama dengan modul djikstra
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'djikstra'))
+from indexed_heap import IndexedHeap
+
+# heap='auto' memakai mode dense jika jumlah edge >= rasio ini dikali jumlah edge graf lengkap (V * (V - 1) / 2)
+DENSE_PRIM_RATIO = 0.25
+
+# Mode dense butuh NumPy; jika tidak terinstall, heap='auto' tetap memakai 'lazy'
+HAS_NUMPY = find_spec('numpy') is not None
+
 class PrimGraph:
     # Constructor, assign jumlah node dan array yang berisi tuple
     # setiap index merupakan node nya yang berisi adjacency list dari node tsb
@@ -16,7 +29,24 @@ class PrimGraph:
         self.adj[u].append((v, w))
         self.adj[v].append((u, w))
 
-    def primMST(self, start=0):
+    def numEdges(self):
+        # Setiap edge tersimpan dua kali (u -> v dan v -> u)
+        return sum(len(neighbors) for neighbors in self.adj) // 2
+
+    def primMST(self, start=0, heap='auto'):
+        # heap='indexed' memakai IndexedHeap dengan decrease_key (ukuran heap paling banyak V)
+        # heap='lazy' memakai heapq dengan lazy deletion seperti biasa
+        # heap='dense' memakai primMSTDense (array key/parent dan argmin NumPy di atas adjacency matrix)
+        # heap='auto' memilih 'dense' jika graf hampir lengkap (lihat DENSE_PRIM_RATIO) dan NumPy tersedia, selain itu 'lazy'
+        if heap == 'auto':
+            dense = HAS_NUMPY and self.numEdges() >= DENSE_PRIM_RATIO * self.V * (self.V - 1) / 2
+            heap = 'dense' if dense else 'lazy'
+
+        if heap in ('indexed', 'dense'):
+            mst, total_cost = self.primMSTIndexed(start) if heap == 'indexed' else self.primMSTDense(start)
+            self.printMST(mst, total_cost)
+            return mst
+
         # Array visited misal node ada 3, maka [False, False, False]
         visited = [False] * self.V
 
@@ -58,6 +88,95 @@ class PrimGraph:
                 if not visited[v]:
                     heapq.heappush(min_heap, (w, v, u))
 
+        self.printMST(mst, total_cost)
+        return mst
+
+    def primMSTIndexed(self, start=0):
+        # key[v] = bobot edge termurah yang menghubungkan v ke tree, parent[v] = node asal edge tsb
+        key = [float('inf')] * self.V
+        parent = [-1] * self.V
+        in_tree = [False] * self.V
+
+        mst = []
+        total_cost = 0
+
+        # Setiap node paling banyak satu kali ada di heap, kalau ada edge lebih murah cukup decrease_key
+        min_heap = IndexedHeap(self.V)
+        key[start] = 0
+        min_heap.push(start, 0)
+
+        while min_heap:
+            u, _ = min_heap.pop()
+            in_tree[u] = True
+
+            if parent[u] != -1:
+                mst.append((parent[u], u, key[u]))
+                total_cost += key[u]
+
+            for v, w in self.adj[u]:
+                if not in_tree[v] and w < key[v]:
+                    key[v] = w
+                    parent[v] = u
+                    min_heap.push(v, w)
+
+        return mst, total_cost
+
+    def adjacencyMatrix(self):
+        # Adjacency matrix NumPy V x V (inf = tidak ada edge), diisi baris per baris langsung dari self.adj
+        # tanpa list Python sebesar seluruh graf, jadi memori tambahannya hanya matrix itu sendiri.
+        # Matrix tidak disimpan di instance: setelah primMSTDense selesai, memorinya langsung dilepas.
+        # NumPy baru di-import di sini dan di primMSTDense, jadi mode lain tetap bisa dipakai tanpa NumPy
+        import numpy as np
+
+        matrix = np.full((self.V, self.V), np.inf)
+        for u, neighbors in enumerate(self.adj):
+            if neighbors:
+                targets = np.fromiter((v for v, _ in neighbors), dtype=np.int64, count=len(neighbors))
+                weights = np.fromiter((w for _, w in neighbors), dtype=np.float64, count=len(neighbors))
+                # Jika ada edge paralel, ambil yang bobotnya paling kecil
+                np.minimum.at(matrix[u], targets, weights)
+        return matrix
+
+    def primMSTDense(self, start=0):
+        # Prim O(V^2) untuk graf padat: tidak ada heap sama sekali, hanya adjacency matrix V x V
+        # serta array key dan parent. Setiap ronde node berikutnya dipilih dengan satu argmin NumPy
+        import numpy as np
+
+        matrix = self.adjacencyMatrix()
+
+        # key[v] = bobot edge termurah yang menghubungkan v ke tree, node yang sudah di tree key-nya inf
+        key = np.full(self.V, np.inf)
+        parent = np.full(self.V, -1)
+        in_tree = np.zeros(self.V, dtype=bool)
+
+        mst = []
+        total_cost = 0
+
+        key[start] = 0
+        for _ in range(self.V):
+            u = int(np.argmin(key))
+            weight = key[u]
+
+            # Sisa node tidak terjangkau dari start (graf tidak terhubung)
+            if weight == np.inf:
+                break
+
+            in_tree[u] = True
+            key[u] = np.inf
+            if parent[u] != -1:
+                weight = int(weight) if weight.is_integer() else float(weight)
+                mst.append((int(parent[u]), u, weight))
+                total_cost += weight
+
+            # Update key semua node di luar tree sekaligus dengan baris u dari matrix
+            row = matrix[u]
+            better = (row < key) & ~in_tree
+            key[better] = row[better]
+            parent[better] = u
+
+        return mst, total_cost
+
+    def printMST(self, mst, total_cost):
         if len(mst) != self.V - 1:
             print("Graf tidak terhubung!")
         else:
@@ -66,8 +185,6 @@ class PrimGraph:
                 print(f"{u} -- {v} == {w}")
             print(f"Minimum Spanning Tree Cost: {total_cost}")
 
-        return mst
-
 def draw_graph_with_mst(adj_list, mst_edges, filename='prim_mst'):
     dot = Graph(comment='Graph with MST')
     mst_set = set(tuple(sorted((u, v))) for u, v, _ in mst_edges)
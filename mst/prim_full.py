@@ -1,6 +1,8 @@
 import re, heapq, graphviz, tkinter
 from tkinter import filedialog
 
+from dynamic_mst import DynamicMST
+
 class Graph:
     def __init__(self):
         """
@@ -9,6 +11,8 @@ class Graph:
         Setiap key pada dictionary ini adalah nama atau identifier dari node, dan value-nya adalah list dari tuple yang berisi node tetangga beserta bobot (weight) dari edge yang menghubungkan kedua node tersebut.
         """
         self.adjacency_list = {}
+        # MST dari graf saat ini yang diperbarui setiap kali node/edge berubah (lihat dynamic_mst.py)
+        self.dynamic_mst = DynamicMST()
         
     def add_node(self, node_name):
         """
@@ -22,6 +26,7 @@ class Graph:
         """
         if node_name not in self.adjacency_list:
             self.adjacency_list[node_name] = []
+            self.dynamic_mst.add_node(node_name)
             print(f"Node '{node_name}' berhasil ditambahkan ke dalam konfigurasi data graf yang termuat saat ini.")
             return True
         else:
@@ -63,12 +68,16 @@ class Graph:
                     self.adjacency_list[v].remove((u, existing_weight))
                     self.adjacency_list[u].append((v, weight))
                     self.adjacency_list[v].append((u, weight))
+                    self.dynamic_mst.update_edge(u, v, weight)
                     print(f"Bobot edge dari '{u}' ke '{v}' dan dari '{v}' ke '{u}' telah berhasil diperbarui menjadi sebesar {weight}.")
+                    print(f"Total bobot MST saat ini: {self.dynamic_mst.total_weight}")
                     return True
         
         self.adjacency_list[u].append((v, weight))
         self.adjacency_list[v].append((u, weight))
+        self.dynamic_mst.insert_edge(u, v, weight)
         print(f"Edge dari '{u}' ke '{v}' dan dari '{v}' ke '{u}' dengan bobot yang sebesar {weight} telah berhasil ditambahkan ke dalam konfigurasi data graf yang termuat saat ini.")
+        print(f"Total bobot MST saat ini: {self.dynamic_mst.total_weight}")
         return True
         
         
@@ -175,6 +184,7 @@ class Graph:
                         if (u, weight) not in self.adjacency_list[v]:
                             self.adjacency_list[v].append((u, weight))
 
+                self.dynamic_mst = DynamicMST.from_adjacency_list(self.adjacency_list)
                 print(f"Graf berhasil dimuat dari file '{file_path}'.")
             else:
                 print("Operasi pemuatan graf dibatalkan.")
@@ -275,6 +285,7 @@ class Graph:
             print("Graf saat ini sudah kosong. Tidak ada data yang perlu dihapus.")
         else:
             self.adjacency_list.clear()
+            self.dynamic_mst = DynamicMST()
             print("Semua konfigurasi data graf yang sedang termuat saat ini sudah berhasil dihapus dari program ini. Graf telah diatur ulang dari awal.")
         
         